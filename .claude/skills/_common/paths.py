@@ -0,0 +1,38 @@
+"""
+Project Root Lookup
+
+Shared by the skill validation scripts, which put this directory on
+sys.path and import find_project_root from here.
+
+Set VIBEFLOW_PROJECT_ROOT to skip searching upward for the project root.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+
+# Overrides the upward search for the project root when set
+PROJECT_ROOT_ENV = "VIBEFLOW_PROJECT_ROOT"
+
+
+def find_project_root(start: Optional[Path] = None) -> Path:
+    """Return $VIBEFLOW_PROJECT_ROOT, else the nearest ancestor with a docs/ dir.
+
+    The environment variable is only consulted when no start directory is
+    given, letting a wrapper that runs several validators resolve the root once.
+    """
+    if start is None:
+        env_root = os.environ.get(PROJECT_ROOT_ENV)
+        if env_root:
+            return Path(env_root)
+        start = Path.cwd()
+
+    # Plain strings and os.path avoid building a Path per ancestor
+    project_root = str(start)
+    while not os.path.isdir(os.path.join(project_root, "docs")):
+        parent = os.path.dirname(project_root) or "."
+        if parent == project_root:
+            break
+        project_root = parent
+    return Path(project_root)
@@ -0,0 +1,103 @@
+"""
+Validation Result Cache
+
+Shared by the feature spec and ADR validators: stores a document's last
+validation result in a per-user directory outside the project, so an
+unchanged document can skip revalidation.
+
+Cached results are named "<prefix>-<path hash>-<key hash>.json".
+"""
+
+import hashlib
+import io
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+def private_dir(path: Path) -> bool:
+    """Create path (mode 0700) if missing; True if it's a real directory only we can use.
+
+    The cache lives in the shared temp dir, where another user could have
+    created the directory first; such a directory, or a symlink, is refused.
+    """
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and stat.S_IMODE(st.st_mode) == 0o700
+
+
+def cache_dir() -> Optional[Path]:
+    """Per-user result cache, kept outside the project, or None if it isn't safe to use."""
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    user_dir = Path(tempfile.gettempdir()) / f"vibeflow-{user}"
+    path = user_dir / "validation"
+    if private_dir(user_dir) and private_dir(path):
+        return path
+    return None
+
+
+def decode_text(data: bytes) -> str:
+    """Decode a document's bytes exactly as Path.read_text() would.
+
+    Validators read a document once as bytes, hash that for the cache key,
+    and validate the decoded buffer instead of reading the file again.
+    """
+    return io.TextIOWrapper(io.BytesIO(data)).read()
+
+
+def result_cache_path(prefix: str, script_path: Path, doc_path: Path, data: bytes,
+                      *key_parts: str) -> Optional[Path]:
+    """Cache file for doc_path's content (data) and the validating script's version.
+
+    Keyed by a digest of the bytes rather than (mtime, size), so switching
+    branches away and back, which rewrites mtimes without changing the text,
+    still hits. None when there is no usable cache directory.
+    """
+    directory = cache_dir()
+    if directory is None:
+        return None
+    content_hash = hashlib.sha1(data).hexdigest()
+    script_mtime = script_path.stat().st_mtime_ns
+    doc_key = "\0".join([str(doc_path.resolve()), *key_parts])
+    path_hash = hashlib.sha1(doc_key.encode()).hexdigest()[:16]
+    key = "\0".join([content_hash, str(script_mtime)])
+    key_hash = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return directory / f"{prefix}-{path_hash}-{key_hash}.json"
+
+
+def read_cached_result(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Return a cached result, or None on a miss or any error."""
+    try:
+        with open(cache_path, "r") as f:
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                return None
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cached_result(cache_path: Path, result: Dict[str, Any]) -> None:
+    """Atomically store result and drop older entries for the same document and options."""
+    try:
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(result))
+        tmp_path.replace(cache_path)
+
+        # Only finished entries: another process's in-flight .tmp file shares the prefix
+        doc_prefix = cache_path.name.rsplit("-", 1)[0] + "-"
+        for entry in os.scandir(cache_path.parent):
+            if (entry.name.startswith(doc_prefix) and entry.name.endswith(".json")
+                    and entry.name != cache_path.name):
+                os.unlink(entry.path)
+    except OSError:
+        pass
@@ -0,0 +1,41 @@
+"""
+Markdown Section Helpers
+
+Shared by the feature spec and ADR validators and the checkpoint scripts:
+locate a section heading without rescanning the whole document per
+pattern, and slice out the section's body.
+"""
+
+import re
+from typing import List, Optional
+
+
+# Section patterns are matched only where a run of '#' starts
+HEADING_PATTERN = re.compile(r"#+")
+
+# A section's body runs until the next top-level heading
+TOP_LEVEL_HEADING_PATTERN = re.compile(r"\n#[^#]")
+
+
+def heading_offsets(content: str) -> List[int]:
+    """Offsets of every run of '#' characters (candidate section headings)."""
+    return [match.start() for match in HEADING_PATTERN.finditer(content)]
+
+
+def find_section(pattern: re.Pattern, content: str, offsets: List[int]) -> Optional[re.Match]:
+    """Match a heading pattern at the first heading offset where it applies.
+
+    Equivalent to pattern.search(content) for patterns starting with '#+',
+    but only tries the offsets collected by heading_offsets().
+    """
+    for offset in offsets:
+        match = pattern.match(content, offset)
+        if match:
+            return match
+    return None
+
+
+def section_body(content: str, heading: re.Match) -> str:
+    """Text after a matched heading, up to the next top-level '#' heading."""
+    end = TOP_LEVEL_HEADING_PATTERN.search(content, heading.end())
+    return content[heading.end():end.start() if end else len(content)]
@@ -4,7 +4,9 @@ Feature Spec Validation Script
 Validates that a feature spec has all required sections including API Design.
 
 Usage:
-    python validate_feature.py <ID> [--size-track TRACK] [--json]
+    python validate_feature.py <ID> [--size-track TRACK] [--json] [--no-cache]
+
+Set VIBEFLOW_PROJECT_ROOT to skip searching upward for the project root.
 
 Exit codes:
     0 - All validations passed
@@ -14,28 +16,66 @@ Exit codes:
 
 import argparse
 import json
+import os
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# find_project_root, the result cache and the section helpers are shared by the skill scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_common"))
+from paths import find_project_root  # noqa: E402
+from result_cache import (  # noqa: E402
+    decode_text, read_cached_result, result_cache_path, write_cached_result
+)
+from sections import find_section, heading_offsets, section_body  # noqa: E402
+
 
 REQUIRED_SECTIONS = [
-    ("Architecture Conformance", r"#+\s*Architecture\s*Conformance"),
-    ("API Design", r"#+\s*API\s*Design"),
-    ("Acceptance Criteria", r"#+\s*Acceptance\s*Criteria"),
-    ("Design Changes", r"#+\s*Design\s*Changes"),
-    ("Test & Eval Plan", r"#+\s*Test"),
-    ("Telemetry", r"#+\s*Telemetry"),
-    ("Edge Cases", r"#+\s*Edge\s*Cases"),
+    ("Architecture Conformance", re.compile(r"#+\s*Architecture\s*Conformance", re.IGNORECASE)),
+    ("API Design", re.compile(r"#+\s*API\s*Design", re.IGNORECASE)),
+    ("Acceptance Criteria", re.compile(r"#+\s*Acceptance\s*Criteria", re.IGNORECASE)),
+    ("Design Changes", re.compile(r"#+\s*Design\s*Changes", re.IGNORECASE)),
+    ("Test & Eval Plan", re.compile(r"#+\s*Test", re.IGNORECASE)),
+    ("Telemetry", re.compile(r"#+\s*Telemetry", re.IGNORECASE)),
+    ("Edge Cases", re.compile(r"#+\s*Edge\s*Cases", re.IGNORECASE)),
 ]
 
 MEDIUM_LARGE_SECTIONS = [
-    ("Stage B Discovery", r"#+\s*Stage\s*B\s*Discovery"),
-    ("Test Impact", r"#+\s*Test\s*Impact"),
-    ("Existing Implementation", r"#+\s*Existing\s*Implementation"),
-    ("Dependency", r"#+\s*Dependency"),
+    ("Stage B Discovery", re.compile(r"#+\s*Stage\s*B\s*Discovery", re.IGNORECASE)),
+    ("Test Impact", re.compile(r"#+\s*Test\s*Impact", re.IGNORECASE)),
+    ("Existing Implementation", re.compile(r"#+\s*Existing\s*Implementation", re.IGNORECASE)),
+    ("Dependency", re.compile(r"#+\s*Dependency", re.IGNORECASE)),
 ]
 
+# Prefix of this validator's cached result files
+CACHE_PREFIX = "feature"
+
+HEADER_PATTERN = re.compile(r"\*\*(?:File|Owner|TECH-SPEC)\*\*", re.IGNORECASE)
+
+API_DESIGN_PATTERN = re.compile(r"#+\s*API\s*Design\s*\n", re.IGNORECASE)
+
+# Signature indicators in the API Design section
+# Any one signature marker; group 1 is set for "async def"
+SIGNATURE_PATTERN = re.compile(
+    r"\*\*Signature\*\*|(async )?def \w+\(|function \w+\(|class \w+|→|->"
+)
+
+ENDPOINT_PATTERN = re.compile(r"(?:GET|POST|PUT|DELETE|PATCH)\s+/")
+
+ACCEPTANCE_CRITERIA_PATTERN = re.compile(r"#+\s*Acceptance\s*Criteria\s*\n", re.IGNORECASE)
+
+# Unchecked task-list items; fixed strings, counted with str.count
+CHECKBOX_MARKERS = ("- [ ]", "* [ ]")
+
+GHERKIN_PATTERN = re.compile(r"(?:Given|When|Then)\s+", re.IGNORECASE)
+
+VAGUE_TERMS = ["should be good", "should work", "must be nice", "easy to use"]
+
+SPEC_REF_PATTERN = re.compile(r"spec-(\w+)\.md(?:\s*\(v[\d.]+\))?", re.IGNORECASE)
+
+VERSIONED_SPEC_PATTERN = re.compile(r"spec-\w+\.md\s*\(v[\d.]+\)", re.IGNORECASE)
+
 
 def find_feature_file(project_root: Path, feature_id: Optional[str]) -> Optional[Path]:
     """Find feature spec file by ID."""
@@ -43,29 +83,34 @@ def find_feature_file(project_root: Path, feature_id: Optional[str]) -> Optional
     if not features_path.exists():
         return None
 
+    # One directory listing serves both the ID lookup and the newest-file fallback
+    with os.scandir(features_path) as it:
+        entries = [
+            e for e in it
+            if e.name.startswith("ft-") and e.name.endswith(".md") and e.name != "schedule.md"
+        ]
+
     if feature_id:
-        matches = list(features_path.glob(f"ft-{feature_id}*.md"))
-        if matches:
-            return matches[0]
+        for entry in entries:
+            if entry.name.startswith(f"ft-{feature_id}"):
+                return Path(entry.path)
 
     # Get most recent feature
-    feature_files = [f for f in features_path.glob("ft-*.md") if f.name != "schedule.md"]
-    if feature_files:
-        return max(feature_files, key=lambda f: f.stat().st_mtime)
+    if entries:
+        return Path(max(entries, key=lambda e: e.stat().st_mtime).path)
 
     return None
 
 
-def validate_api_design(content: str) -> Dict[str, Any]:
+def validate_api_design(content: str, offsets: Optional[List[int]] = None,
+                        content_lower: Optional[str] = None) -> Dict[str, Any]:
     """Validate API Design section has required elements."""
     result = {"valid": True, "issues": [], "warnings": [], "signatures_found": 0}
 
     # Find API Design section
-    api_match = re.search(
-        r"#+\s*API\s*Design\s*\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    if offsets is None:
+        offsets = heading_offsets(content)
+    api_match = find_section(API_DESIGN_PATTERN, content, offsets)
 
     if not api_match:
         result["valid"] = False
@@ -75,22 +120,13 @@ def validate_api_design(content: str) -> Dict[str, Any]:
         })
         return result
 
-    api_section = api_match.group(1)
+    api_section = section_body(content, api_match)
 
     # Check for signature indicators
-    signature_patterns = [
-        r"\*\*Signature\*\*",
-        r"def \w+\(",
-        r"function \w+\(",
-        r"async def \w+\(",
-        r"class \w+",
-        r"→|->",
-    ]
-
     signature_count = 0
-    for pattern in signature_patterns:
-        matches = re.findall(pattern, api_section)
-        signature_count += len(matches)
+    for match in SIGNATURE_PATTERN.finditer(api_section):
+        # "async def" counts as both a def and an async def signature
+        signature_count += 2 if match.group(1) else 1
 
     result["signatures_found"] = signature_count
 
@@ -101,21 +137,24 @@ def validate_api_design(content: str) -> Dict[str, Any]:
             "message": "API Design must include function/method signatures"
         })
 
-    # Check for parameter documentation
-    if "parameter" not in api_section.lower() and "param" not in api_section.lower():
+    # Check for parameter documentation ("param" also covers "parameter")
+    api_lower = api_section.lower()
+    if "param" not in api_lower:
         result["warnings"].append({
             "message": "API Design should document parameters"
         })
 
     # Check for return type documentation
-    if "return" not in api_section.lower():
+    if "return" not in api_lower:
         result["warnings"].append({
             "message": "API Design should document return types"
         })
 
     # Check for API endpoints if mentioned
-    if "endpoint" in content.lower() or "/api/" in content:
-        if not re.search(r"(?:GET|POST|PUT|DELETE|PATCH)\s+/", api_section):
+    if content_lower is None:
+        content_lower = content.lower()
+    if "endpoint" in content_lower or "/api/" in content:
+        if not ENDPOINT_PATTERN.search(api_section):
             result["warnings"].append({
                 "message": "Feature mentions endpoints but API Design lacks HTTP method/path"
             })
@@ -123,16 +162,14 @@ def validate_api_design(content: str) -> Dict[str, Any]:
     return result
 
 
-def validate_acceptance_criteria(content: str) -> Dict[str, Any]:
+def validate_acceptance_criteria(content: str, offsets: Optional[List[int]] = None) -> Dict[str, Any]:
     """Validate acceptance criteria are testable."""
     result = {"valid": True, "issues": [], "warnings": [], "criteria_count": 0}
 
     # Find Acceptance Criteria section
-    ac_match = re.search(
-        r"#+\s*Acceptance\s*Criteria\s*\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    if offsets is None:
+        offsets = heading_offsets(content)
+    ac_match = find_section(ACCEPTANCE_CRITERIA_PATTERN, content, offsets)
 
     if not ac_match:
         result["valid"] = False
@@ -142,11 +179,11 @@ def validate_acceptance_criteria(content: str) -> Dict[str, Any]:
         })
         return result
 
-    ac_section = ac_match.group(1)
+    ac_section = section_body(content, ac_match)
 
     # Count criteria (checkboxes or Gherkin)
-    checkbox_count = len(re.findall(r"- \[ \]|\* \[ \]", ac_section))
-    gherkin_count = len(re.findall(r"(?:Given|When|Then)\s+", ac_section, re.IGNORECASE))
+    checkbox_count = sum(ac_section.count(marker) for marker in CHECKBOX_MARKERS)
+    gherkin_count = len(GHERKIN_PATTERN.findall(ac_section))
 
     result["criteria_count"] = max(checkbox_count, gherkin_count // 3)
 
@@ -156,9 +193,9 @@ def validate_acceptance_criteria(content: str) -> Dict[str, Any]:
         })
 
     # Check for testable language
-    vague_terms = ["should be good", "should work", "must be nice", "easy to use"]
-    for term in vague_terms:
-        if term in ac_section.lower():
+    ac_lower = ac_section.lower()
+    for term in VAGUE_TERMS:
+        if term in ac_lower:
             result["warnings"].append({
                 "message": f"Acceptance criteria should be specific, not vague ('{term}')"
             })
@@ -166,12 +203,14 @@ def validate_acceptance_criteria(content: str) -> Dict[str, Any]:
     return result
 
 
-def validate_spec_links(content: str) -> Dict[str, Any]:
+def validate_spec_links(content: str, content_lower: Optional[str] = None) -> Dict[str, Any]:
     """Validate links to TECH-SPECs with versions."""
     result = {"valid": True, "issues": [], "warnings": [], "specs_linked": []}
 
-    # Find spec references
-    spec_refs = re.findall(r"spec-(\w+)\.md(?:\s*\(v[\d.]+\))?", content, re.IGNORECASE)
+    # Find spec references; the patterns are case-insensitive, so is the prefilter
+    if content_lower is None:
+        content_lower = content.lower()
+    spec_refs = SPEC_REF_PATTERN.findall(content) if "spec-" in content_lower else []
     result["specs_linked"] = list(set(spec_refs))
 
     if not spec_refs:
@@ -183,7 +222,7 @@ def validate_spec_links(content: str) -> Dict[str, Any]:
         return result
 
     # Check for version numbers
-    versioned = len(re.findall(r"spec-\w+\.md\s*\(v[\d.]+\)", content, re.IGNORECASE))
+    versioned = len(VERSIONED_SPEC_PATTERN.findall(content))
     if versioned < len(set(spec_refs)):
         result["warnings"].append({
             "message": "TECH-SPEC references should include version numbers"
@@ -192,8 +231,12 @@ def validate_spec_links(content: str) -> Dict[str, Any]:
     return result
 
 
-def validate_feature(feature_path: Path, size_track: str = "medium") -> Dict[str, Any]:
-    """Validate feature spec document."""
+def validate_feature(feature_path: Path, size_track: str = "medium",
+                     use_cache: bool = False) -> Dict[str, Any]:
+    """Validate feature spec document.
+
+    With use_cache, an unchanged file reuses the result of its last validation.
+    """
     result = {
         "file": str(feature_path),
         "valid": True,
@@ -212,17 +255,33 @@ def validate_feature(feature_path: Path, size_track: str = "medium") -> Dict[str
         })
         return result
 
-    content = feature_path.read_text()
+    # Read once: the bytes key the cache and are decoded for validation
+    data = feature_path.read_bytes()
+    cache_path = (
+        result_cache_path(CACHE_PREFIX, Path(__file__), feature_path, data, size_track)
+        if use_cache else None
+    )
+    if cache_path:
+        cached = read_cached_result(cache_path)
+        if cached is not None:
+            cached["file"] = str(feature_path)
+            return cached
+
+    content = decode_text(data)
 
     # Check header
-    if not re.search(r"\*\*(?:File|Owner|TECH-SPEC)\*\*", content, re.IGNORECASE):
+    if not HEADER_PATTERN.search(content):
         result["warnings"].append({
             "message": "Feature should have header with File, Owner, TECH-SPECs"
         })
 
+    # Locate headings and lowercase once; shared by the checks below
+    offsets = heading_offsets(content)
+    content_lower = content.lower()
+
     # Check required sections
     for section_name, pattern in REQUIRED_SECTIONS:
-        if re.search(pattern, content, re.IGNORECASE):
+        if find_section(pattern, content, offsets):
             result["sections_found"].append(section_name)
         else:
             result["sections_missing"].append(section_name)
@@ -236,14 +295,14 @@ def validate_feature(feature_path: Path, size_track: str = "medium") -> Dict[str
     # Check Medium/Large specific sections
     if size_track in ["medium", "large"]:
         for section_name, pattern in MEDIUM_LARGE_SECTIONS:
-            if not re.search(pattern, content, re.IGNORECASE):
+            if not find_section(pattern, content, offsets):
                 result["warnings"].append({
                     "section": section_name,
                     "message": f"Missing section for Medium/Large: {section_name}"
                 })
 
     # Validate API Design
-    api_result = validate_api_design(content)
+    api_result = validate_api_design(content, offsets, content_lower)
     if not api_result["valid"]:
         result["valid"] = False
         result["issues"].extend(api_result["issues"])
@@ -251,7 +310,7 @@ def validate_feature(feature_path: Path, size_track: str = "medium") -> Dict[str
     result["api_signatures"] = api_result.get("signatures_found", 0)
 
     # Validate Acceptance Criteria
-    ac_result = validate_acceptance_criteria(content)
+    ac_result = validate_acceptance_criteria(content, offsets)
     if not ac_result["valid"]:
         result["valid"] = False
         result["issues"].extend(ac_result["issues"])
@@ -259,13 +318,16 @@ def validate_feature(feature_path: Path, size_track: str = "medium") -> Dict[str
     result["acceptance_criteria_count"] = ac_result.get("criteria_count", 0)
 
     # Validate spec links
-    links_result = validate_spec_links(content)
+    links_result = validate_spec_links(content, content_lower)
     if not links_result["valid"]:
         result["valid"] = False
         result["issues"].extend(links_result["issues"])
     result["warnings"].extend(links_result.get("warnings", []))
     result["specs_linked"] = links_result.get("specs_linked", [])
 
+    if cache_path:
+        write_cached_result(cache_path, result)
+
     return result
 
 
@@ -276,15 +338,13 @@ def main():
     parser.add_argument("--size-track", "-s", choices=["micro", "small", "medium", "large"],
                         default="medium", help="Size track for the change")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Revalidate even if the file is unchanged since the last run")
 
     args = parser.parse_args()
 
     # Find project root
-    project_root = Path.cwd()
-    while project_root != project_root.parent:
-        if (project_root / "docs").is_dir():
-            break
-        project_root = project_root.parent
+    project_root = find_project_root()
 
     # Find feature file
     if args.path:
@@ -295,10 +355,9 @@ def main():
     if not feature_path:
         error = {"valid": False, "issues": [{"severity": "error", "message": "No feature file found"}]}
         print(json.dumps(error))
-        import sys
         sys.exit(1)
 
-    result = validate_feature(feature_path, args.size_track)
+    result = validate_feature(feature_path, args.size_track, use_cache=not args.no_cache)
 
     if args.json:
         print(json.dumps(result, indent=2))
@@ -333,7 +392,6 @@ def main():
         status = "PASSED" if result["valid"] else "FAILED"
         print(f"\nResult: {status}")
 
-    import sys
     sys.exit(0 if result["valid"] else 1)
 
 
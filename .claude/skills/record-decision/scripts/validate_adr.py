@@ -4,7 +4,9 @@ ADR Validation Script
 Validates that an ADR has all required sections.
 
 Usage:
-    python validate_adr.py <ID> [--json]
+    python validate_adr.py <ID> [--json] [--no-cache]
+
+Set VIBEFLOW_PROJECT_ROOT to skip searching upward for the project root.
 
 Exit codes:
     0 - All validations passed
@@ -14,23 +16,49 @@ Exit codes:
 
 import argparse
 import json
+import os
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# find_project_root, the result cache and the section helpers are shared by the skill scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_common"))
+from paths import find_project_root  # noqa: E402
+from result_cache import (  # noqa: E402
+    decode_text, read_cached_result, result_cache_path, write_cached_result
+)
+from sections import find_section, heading_offsets, section_body  # noqa: E402
+
 
 REQUIRED_SECTIONS = [
-    ("Context", r"#+\s*Context"),
-    ("Decision", r"#+\s*Decision"),
-    ("Consequences", r"#+\s*Consequences"),
-    ("Alternatives", r"#+\s*Alternatives"),
-    ("Rollback", r"#+\s*Rollback"),
+    ("Context", re.compile(r"#+\s*Context", re.IGNORECASE)),
+    ("Decision", re.compile(r"#+\s*Decision", re.IGNORECASE)),
+    ("Consequences", re.compile(r"#+\s*Consequences", re.IGNORECASE)),
+    ("Alternatives", re.compile(r"#+\s*Alternatives", re.IGNORECASE)),
+    ("Rollback", re.compile(r"#+\s*Rollback", re.IGNORECASE)),
 ]
 
 RECOMMENDED_SECTIONS = [
-    ("Links", r"#+\s*Links"),
+    ("Links", re.compile(r"#+\s*Links", re.IGNORECASE)),
 ]
 
+# Prefix of this validator's cached result files
+CACHE_PREFIX = "adr"
+
+STATUS_PATTERN = re.compile(r"\*\*Status\*\*")
+STATUS_VALUE_PATTERN = re.compile(r"\*\*Status\*\*[:\s]*(\w+)", re.IGNORECASE)
+FILE_PATTERN = re.compile(r"\*\*File\*\*")
+
+CONSEQUENCES_PATTERN = re.compile(r"#+\s*Consequences[^\n]*\n", re.IGNORECASE)
+# Searched in lowercased section text, so no IGNORECASE needed
+POSITIVE_PATTERN = re.compile(r"(?:\+|positive|pro|benefit)")
+NEGATIVE_PATTERN = re.compile(r"(?:−|-|negative|con|tradeoff|cost)")
+
+ALTERNATIVES_PATTERN = re.compile(r"#+\s*Alternatives[^\n]*\n", re.IGNORECASE)
+
+ROLLBACK_PATTERN = re.compile(r"#+\s*Rollback[^\n]*\n", re.IGNORECASE)
+
 
 def find_adr_file(project_root: Path, adr_id: Optional[str]) -> Optional[Path]:
     """Find ADR file by ID."""
@@ -38,21 +66,27 @@ def find_adr_file(project_root: Path, adr_id: Optional[str]) -> Optional[Path]:
     if not adrs_path.exists():
         return None
 
+    # One directory listing serves both the ID lookup and the newest-file fallback
+    with os.scandir(adrs_path) as it:
+        entries = [e for e in it if e.name.startswith("adr-") and e.name.endswith(".md")]
+
     if adr_id:
-        matches = list(adrs_path.glob(f"adr-{adr_id}*.md"))
-        if matches:
-            return matches[0]
+        for entry in entries:
+            if entry.name.startswith(f"adr-{adr_id}"):
+                return Path(entry.path)
 
     # Get most recent ADR
-    adr_files = list(adrs_path.glob("adr-*.md"))
-    if adr_files:
-        return max(adr_files, key=lambda f: f.stat().st_mtime)
+    if entries:
+        return Path(max(entries, key=lambda e: e.stat().st_mtime).path)
 
     return None
 
 
-def validate_adr(adr_path: Path) -> Dict[str, Any]:
-    """Validate ADR document."""
+def validate_adr(adr_path: Path, use_cache: bool = False) -> Dict[str, Any]:
+    """Validate ADR document.
+
+    With use_cache, an unchanged file reuses the result of its last validation.
+    """
     result = {
         "file": str(adr_path),
         "valid": True,
@@ -70,16 +104,28 @@ def validate_adr(adr_path: Path) -> Dict[str, Any]:
         })
         return result
 
-    content = adr_path.read_text()
+    # Read once: the bytes key the cache and are decoded for validation
+    data = adr_path.read_bytes()
+    cache_path = (
+        result_cache_path(CACHE_PREFIX, Path(__file__), adr_path, data)
+        if use_cache else None
+    )
+    if cache_path:
+        cached = read_cached_result(cache_path)
+        if cached is not None:
+            cached["file"] = str(adr_path)
+            return cached
+
+    content = decode_text(data)
 
     # Check header
-    if not re.search(r"\*\*Status\*\*", content):
+    if not STATUS_PATTERN.search(content):
         result["warnings"].append({
             "message": "ADR should have Status in header (Draft/Accepted/Rejected/Superseded)"
         })
     else:
         # Check status value
-        status_match = re.search(r"\*\*Status\*\*[:\s]*(\w+)", content, re.IGNORECASE)
+        status_match = STATUS_VALUE_PATTERN.search(content)
         if status_match:
             status = status_match.group(1).lower()
             valid_statuses = ["draft", "accepted", "rejected", "superseded"]
@@ -88,14 +134,17 @@ def validate_adr(adr_path: Path) -> Dict[str, Any]:
                     "message": f"ADR status should be one of: {', '.join(valid_statuses)}"
                 })
 
-    if not re.search(r"\*\*File\*\*", content):
+    if not FILE_PATTERN.search(content):
         result["warnings"].append({
             "message": "ADR should have File path in header"
         })
 
+    # Locate headings once; section checks only look at these offsets
+    offsets = heading_offsets(content)
+
     # Check required sections
     for section_name, pattern in REQUIRED_SECTIONS:
-        if re.search(pattern, content, re.IGNORECASE):
+        if find_section(pattern, content, offsets):
             result["sections_found"].append(section_name)
         else:
             result["sections_missing"].append(section_name)
@@ -108,7 +157,7 @@ def validate_adr(adr_path: Path) -> Dict[str, Any]:
 
     # Check recommended sections
     for section_name, pattern in RECOMMENDED_SECTIONS:
-        if re.search(pattern, content, re.IGNORECASE):
+        if find_section(pattern, content, offsets):
             result["sections_found"].append(section_name)
         else:
             result["warnings"].append({
@@ -117,15 +166,11 @@ def validate_adr(adr_path: Path) -> Dict[str, Any]:
             })
 
     # Check Consequences has positive and negative
-    consequences_match = re.search(
-        r"#+\s*Consequences.*?\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    consequences_match = find_section(CONSEQUENCES_PATTERN, content, offsets)
     if consequences_match:
-        cons_content = consequences_match.group(1)
-        has_positive = bool(re.search(r"(?:\+|positive|pro|benefit)", cons_content, re.IGNORECASE))
-        has_negative = bool(re.search(r"(?:−|-|negative|con|tradeoff|cost)", cons_content, re.IGNORECASE))
+        cons_lower = section_body(content, consequences_match).lower()
+        has_positive = bool(POSITIVE_PATTERN.search(cons_lower))
+        has_negative = bool(NEGATIVE_PATTERN.search(cons_lower))
 
         if not has_positive:
             result["warnings"].append({
@@ -139,13 +184,9 @@ def validate_adr(adr_path: Path) -> Dict[str, Any]:
             })
 
     # Check Alternatives has at least one alternative
-    alternatives_match = re.search(
-        r"#+\s*Alternatives.*?\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    alternatives_match = find_section(ALTERNATIVES_PATTERN, content, offsets)
     if alternatives_match:
-        alt_content = alternatives_match.group(1)
+        alt_content = section_body(content, alternatives_match)
         if len(alt_content.strip()) < 50:
             result["warnings"].append({
                 "section": "Alternatives",
@@ -153,19 +194,18 @@ def validate_adr(adr_path: Path) -> Dict[str, Any]:
             })
 
     # Check Rollback has actionable steps
-    rollback_match = re.search(
-        r"#+\s*Rollback.*?\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    rollback_match = find_section(ROLLBACK_PATTERN, content, offsets)
     if rollback_match:
-        rollback_content = rollback_match.group(1)
+        rollback_content = section_body(content, rollback_match)
         if len(rollback_content.strip()) < 30:
             result["warnings"].append({
                 "section": "Rollback",
                 "message": "Rollback section should include specific steps"
             })
 
+    if cache_path:
+        write_cached_result(cache_path, result)
+
     return result
 
 
@@ -174,15 +214,13 @@ def main():
     parser.add_argument("id", nargs="?", help="ADR ID (e.g., 001, 045)")
     parser.add_argument("--path", "-p", help="Direct path to ADR file")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Revalidate even if the file is unchanged since the last run")
 
     args = parser.parse_args()
 
     # Find project root
-    project_root = Path.cwd()
-    while project_root != project_root.parent:
-        if (project_root / "docs").is_dir():
-            break
-        project_root = project_root.parent
+    project_root = find_project_root()
 
     # Find ADR file
     if args.path:
@@ -192,10 +230,9 @@ def main():
 
     if not adr_path:
         print(json.dumps({"valid": False, "issues": [{"severity": "error", "message": "No ADR file found"}]}))
-        import sys
         sys.exit(1)
 
-    result = validate_adr(adr_path)
+    result = validate_adr(adr_path, use_cache=not args.no_cache)
 
     if args.json:
         print(json.dumps(result, indent=2))
@@ -226,7 +263,6 @@ def main():
         status = "PASSED" if result["valid"] else "FAILED"
         print(f"\nResult: {status}")
 
-    import sys
     sys.exit(0 if result["valid"] else 1)
 
 
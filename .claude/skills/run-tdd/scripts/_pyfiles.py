@@ -0,0 +1,93 @@
+"""
+Python File Listing
+
+Shared by the run-tdd scripts: lists a project's .py files once, from
+`git ls-files` inside a git work tree and from a directory walk elsewhere.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import AbstractSet, List, Optional
+
+
+# Directories never descended into when collecting Python files
+PRUNED_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv", "node_modules"})
+
+# Seconds to wait for `git ls-files` before walking the tree instead
+GIT_TIMEOUT = 5
+
+# `git ls-files -t` tags for index entries with no file in the work tree:
+# deleted, and outside a sparse checkout
+MISSING_TAGS = {b"R", b"S"}
+
+
+def git_python_files(project_root: Path) -> Optional[List[str]]:
+    """List the .py files git sees under project_root, relative to it.
+
+    Untracked files that .gitignore doesn't exclude are included, so freshly
+    written stubs and tests still show up; tracked files that are no longer
+    in the work tree are not. Returns None outside a git work tree or when
+    git can't be run.
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(project_root), "ls-files", "-z", "-t", "--cached", "--others",
+             "--deleted", "--exclude-standard", "--", "*.py"],
+            capture_output=True,
+            timeout=GIT_TIMEOUT
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+
+    # "<tag> <path>" records; a merge conflict lists its path once per stage
+    listed = {}
+    missing = set()
+    for record in proc.stdout.split(b"\0"):
+        if not record:
+            continue
+        path = os.fsdecode(record[2:])
+        if record[:1] in MISSING_TAGS:
+            missing.add(path)
+        else:
+            listed[path] = None
+    return [path for path in listed if path not in missing]
+
+
+def walk_python_files(project_root: Path, pruned_dirs: AbstractSet[str]) -> List[str]:
+    """List .py files under project_root, relative to it, with os.scandir."""
+    files = []
+    stack = [(str(project_root), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in pruned_dirs:
+                            stack.append((entry.path, rel_dir + entry.name + "/"))
+                    elif entry.name.endswith(".py"):
+                        files.append(rel_dir + entry.name)
+        except OSError:
+            continue
+    return files
+
+
+def list_python_files(project_root: Path, pruned_dirs: AbstractSet[str] = PRUNED_DIRS) -> List[str]:
+    """List .py paths under project_root, relative to it with '/' separators.
+
+    Inside a git work tree the list comes from one `git ls-files` call, which
+    also honors .gitignore; otherwise the tree is walked. Directories named
+    in pruned_dirs are skipped either way. Paths are sorted, so both sources
+    give the same order and "first N files" samples don't depend on
+    directory listing order.
+    """
+    rel_paths = git_python_files(project_root)
+    if rel_paths is None:
+        return sorted(walk_python_files(project_root, pruned_dirs))
+    return sorted(
+        rel_path for rel_path in rel_paths
+        if pruned_dirs.isdisjoint(rel_path.split("/")[:-1])
+    )
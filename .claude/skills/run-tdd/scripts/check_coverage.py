@@ -6,6 +6,8 @@ Reports test coverage information and gaps.
 Usage:
     python check_coverage.py [--json]
 
+Set VIBEFLOW_PROJECT_ROOT to skip searching upward for the project root.
+
 Note: This script provides guidance on coverage checking.
       Actual coverage must be run with pytest --cov or similar.
 
@@ -15,70 +17,93 @@ Exit codes:
 
 import argparse
 import json
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, List, Any, Tuple
+
+# find_project_root is shared by the skill scripts, the .py listing by run-tdd's
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_common"))
+from paths import find_project_root  # noqa: E402
+from _pyfiles import PRUNED_DIRS, list_python_files  # noqa: E402
+
+
+# Migrations are generated code, never modules that need tests
+COVERAGE_PRUNED_DIRS = PRUNED_DIRS | {"migrations"}
+
+# Files that are config or boilerplate rather than code needing tests
+EXCLUDED_MODULE_NAMES = {
+    "conftest.py",
+    "__init__.py",
+    "settings.py",
+    "config.py",
+    "manage.py",
+    "wsgi.py",
+    "asgi.py",
+}
+
+# Any of these at the project root means pytest is configured
+PYTEST_CONFIG_FILES = {"pytest.ini", "pyproject.toml", "setup.cfg"}
 
+# (path relative to the project root, file name, parent directory name)
+PyFile = Tuple[str, str, str]
 
-def find_testable_modules(project_root: Path) -> Dict[str, Any]:
+
+def collect_python_files(project_root: Path) -> List[PyFile]:
+    """List every .py file once, in path order."""
+    files = []
+    for rel_path in list_python_files(project_root, COVERAGE_PRUNED_DIRS):
+        parts = rel_path.split("/")
+        parent = parts[-2] if len(parts) > 1 else project_root.name
+        files.append((os.sep.join(parts), parts[-1], parent))
+    return files
+
+
+def find_testable_modules(files: List[PyFile]) -> Dict[str, Any]:
     """Find Python modules that should have test coverage."""
     modules = []
 
     # Find Python files that aren't tests or config
-    exclude_patterns = [
-        "test_*.py",
-        "*_test.py",
-        "conftest.py",
-        "__init__.py",
-        "settings.py",
-        "config.py",
-        "manage.py",
-        "wsgi.py",
-        "asgi.py",
-    ]
-
-    for py_file in project_root.glob("**/*.py"):
-        if "__pycache__" in str(py_file):
+    for rel_path, name, parent in files:
+        if "migrations" in rel_path:
             continue
-        if "migrations" in str(py_file):
-            continue
-        if "tests" in str(py_file) or "test" == py_file.parent.name:
+        if "tests" in rel_path or "test" == parent:
             continue
 
-        should_exclude = False
-        for pattern in exclude_patterns:
-            if py_file.match(pattern):
-                should_exclude = True
-                break
+        if name in EXCLUDED_MODULE_NAMES or name.startswith("test_") or name.endswith("_test.py"):
+            continue
 
-        if not should_exclude:
-            modules.append(str(py_file.relative_to(project_root)))
+        modules.append(rel_path)
 
     return {"modules": modules, "count": len(modules)}
 
 
-def find_test_files(project_root: Path) -> Dict[str, Any]:
-    """Find test files."""
-    test_files = []
+def is_test_file(name: str, parent: str) -> bool:
+    """Match the test_*.py, tests/*.py and *_test.py layouts."""
+    return name.startswith("test_") or parent == "tests" or name.endswith("_test.py")
+
 
-    patterns = ["**/test_*.py", "**/tests/*.py", "**/*_test.py"]
-    for pattern in patterns:
-        for f in project_root.glob(pattern):
-            if "__pycache__" not in str(f):
-                test_files.append(str(f.relative_to(project_root)))
+def find_test_files(files: List[PyFile]) -> Dict[str, Any]:
+    """Find test files.
 
-    return {"files": list(set(test_files)), "count": len(set(test_files))}
+    The listing names each file once, so no deduplication is needed.
+    """
+    test_files = [rel_path for rel_path, name, parent in files if is_test_file(name, parent)]
+
+    return {"files": test_files, "count": len(test_files)}
 
 
 def suggest_coverage_commands(project_root: Path) -> Dict[str, Any]:
     """Suggest commands to run coverage."""
     commands = []
 
-    # Check for pytest
-    has_pytest = (
-        (project_root / "pytest.ini").exists() or
-        (project_root / "pyproject.toml").exists() or
-        (project_root / "setup.cfg").exists()
-    )
+    # Check for pytest; one listing of the root answers all three names
+    try:
+        with os.scandir(project_root) as entries:
+            root_names = {entry.name for entry in entries}
+    except OSError:
+        root_names = set()
+    has_pytest = not PYTEST_CONFIG_FILES.isdisjoint(root_names)
 
     if has_pytest:
         commands.append({
@@ -106,51 +131,46 @@ def suggest_coverage_commands(project_root: Path) -> Dict[str, Any]:
     return {"commands": commands}
 
 
-def estimate_coverage_gaps(project_root: Path) -> Dict[str, Any]:
+def estimate_coverage_gaps(files: List[PyFile]) -> Dict[str, Any]:
     """Estimate potential coverage gaps based on file analysis."""
     gaps = []
 
+    # Index file names once; each "is there a test for X?" query is then a lookup
+    names = {name for _, name, _ in files}
+    has_api_tests = any(
+        parent == "tests" and name.startswith("test_api") for _, name, parent in files
+    )
+
     # Check for services without tests
-    service_files = list(project_root.glob("**/services/**/*.py"))
-    service_files = [f for f in service_files if "__pycache__" not in str(f) and "__init__" not in f.name]
+    services_dir = f"{os.sep}services{os.sep}"
+    service_files = [
+        (rel_path, name) for rel_path, name, _ in files
+        if services_dir in os.sep + rel_path and "__init__" not in name
+    ]
 
-    for service_file in service_files[:10]:
-        service_name = service_file.stem
+    for rel_path, name in service_files[:10]:
+        service_name = name[:-len(".py")]
         # Look for corresponding test file
-        test_patterns = [
-            f"**/test_{service_name}.py",
-            f"**/tests/test_{service_name}.py",
-            f"**/{service_name}_test.py"
-        ]
-
-        has_test = False
-        for pattern in test_patterns:
-            if list(project_root.glob(pattern)):
-                has_test = True
-                break
+        has_test = f"test_{service_name}.py" in names or f"{service_name}_test.py" in names
 
         if not has_test:
             gaps.append({
-                "file": str(service_file.relative_to(project_root)),
+                "file": rel_path,
                 "reason": "No corresponding test file found",
                 "priority": "high"
             })
 
     # Check for views/routes without tests
-    view_files = list(project_root.glob("**/views.py")) + list(project_root.glob("**/routes.py"))
-    for view_file in view_files[:5]:
-        parent = view_file.parent.name
-        test_patterns = [f"**/test_{parent}*.py", f"**/tests/test_api*.py"]
-
-        has_test = False
-        for pattern in test_patterns:
-            if list(project_root.glob(pattern)):
-                has_test = True
-                break
+    view_files = (
+        [(rel_path, parent) for rel_path, name, parent in files if name == "views.py"] +
+        [(rel_path, parent) for rel_path, name, parent in files if name == "routes.py"]
+    )
+    for rel_path, parent in view_files[:5]:
+        has_test = has_api_tests or any(name.startswith(f"test_{parent}") for name in names)
 
         if not has_test:
             gaps.append({
-                "file": str(view_file.relative_to(project_root)),
+                "file": rel_path,
                 "reason": "API endpoints may lack integration tests",
                 "priority": "high"
             })
@@ -168,12 +188,15 @@ def validate(project_root: Path) -> Dict[str, Any]:
         "recommendations": []
     }
 
+    # Walk the tree once; the module, test and gap checks share the listing
+    files = collect_python_files(project_root)
+
     # Find testable modules
-    modules = find_testable_modules(project_root)
+    modules = find_testable_modules(files)
     result["summary"]["testable_modules"] = modules["count"]
 
     # Find test files
-    tests = find_test_files(project_root)
+    tests = find_test_files(files)
     result["summary"]["test_files"] = tests["count"]
 
     # Calculate ratio
@@ -191,7 +214,7 @@ def validate(project_root: Path) -> Dict[str, Any]:
     result["commands"] = commands["commands"]
 
     # Estimate gaps
-    gaps = estimate_coverage_gaps(project_root)
+    gaps = estimate_coverage_gaps(files)
     result["gaps"] = gaps["gaps"]
 
     if gaps["count"] > 0:
@@ -214,11 +237,7 @@ def main():
 
     args = parser.parse_args()
 
-    project_root = Path(args.project_root) if args.project_root else Path.cwd()
-    while project_root != project_root.parent:
-        if (project_root / "docs").is_dir():
-            break
-        project_root = project_root.parent
+    project_root = find_project_root(Path(args.project_root) if args.project_root else None)
 
     result = validate(project_root)
 
@@ -250,7 +269,6 @@ def main():
             for rec in result["recommendations"]:
                 print(f"  - {rec['message']}")
 
-    import sys
     sys.exit(0)
 
 
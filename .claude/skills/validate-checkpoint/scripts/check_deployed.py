@@ -15,12 +15,25 @@ Exit codes:
     2 - Warnings only
 """
 
+import os
 import re
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 
+# The docs checks only look for ASCII tokens, so Markdown files are read as
+# bytes and never decoded
+VERSION_PATTERN = re.compile(rb"v\d+\.\d+\.\d+")
+OPNOTE_LINK_PATTERN = re.compile(rb"op-[\w-]+\.md")
+
+# How many of the newest release tags to report
+RECENT_TAG_COUNT = 5
+
+# A feature counts as done if one of these follows its ID on the same line
+DONE_STATUS_WORDS = (b"done", b"complete", b"shipped", b"released")
+
+
 def check_spec_index(docs_path: Path) -> Dict[str, Any]:
     """Check if docs/specs/index.md has Current versions marked."""
     result = {"valid": True, "issues": [], "warnings": []}
@@ -32,17 +45,16 @@ def check_spec_index(docs_path: Path) -> Dict[str, Any]:
         })
         return result
 
-    content = index_path.read_text()
+    data = index_path.read_bytes()
 
     # Check for Current marker
-    if "current" not in content.lower():
+    if b"current" not in data.lower():
         result["warnings"].append({
             "message": "Spec index doesn't mark any version as Current"
         })
 
     # Check for version numbers
-    versions = re.findall(r"v\d+\.\d+\.\d+", content)
-    if not versions:
+    if not VERSION_PATTERN.search(data):
         result["warnings"].append({
             "message": "Spec index doesn't list version numbers"
         })
@@ -50,6 +62,26 @@ def check_spec_index(docs_path: Path) -> Dict[str, Any]:
     return result
 
 
+def feature_marked_done(data: bytes, feature_id: str) -> bool:
+    """Whether a line of the schedule has ft-<id> followed by a done status.
+
+    Finds the ID literally, then checks only the rest of its line, instead
+    of letting a lazy ".*?" regex backtrack over the schedule.
+    """
+    lowered = data.lower()
+    needle = f"ft-{feature_id}".lower().encode()
+    start = lowered.find(needle)
+    while start != -1:
+        line_end = lowered.find(b"\n", start)
+        if line_end == -1:
+            line_end = len(lowered)
+        rest = lowered[start + len(needle):line_end]
+        if any(word in rest for word in DONE_STATUS_WORDS):
+            return True
+        start = lowered.find(needle, line_end)
+    return False
+
+
 def check_feature_schedule(docs_path: Path, feature_id: Optional[str]) -> Dict[str, Any]:
     """Check if feature schedule shows Done status."""
     result = {"valid": True, "issues": [], "warnings": []}
@@ -61,18 +93,18 @@ def check_feature_schedule(docs_path: Path, feature_id: Optional[str]) -> Dict[s
         })
         return result
 
-    content = schedule_path.read_text()
+    data = schedule_path.read_bytes()
 
     if feature_id:
         # Check specific feature status
-        feature_pattern = rf"ft-{feature_id}.*?(?:done|complete|shipped|released)"
-        if not re.search(feature_pattern, content, re.IGNORECASE):
+        if not feature_marked_done(data, feature_id):
             result["warnings"].append({
                 "message": f"Feature ft-{feature_id} not marked as Done in schedule"
             })
     else:
         # Check for any Done features
-        if "done" not in content.lower() and "complete" not in content.lower():
+        lowered = data.lower()
+        if b"done" not in lowered and b"complete" not in lowered:
             result["warnings"].append({
                 "message": "No features marked as Done in schedule"
             })
@@ -91,11 +123,10 @@ def check_opnotes_index(docs_path: Path) -> Dict[str, Any]:
         })
         return result
 
-    content = index_path.read_text()
+    data = index_path.read_bytes()
 
     # Check for recent links
-    opnote_links = re.findall(r"op-[\w-]+\.md", content)
-    if not opnote_links:
+    if not OPNOTE_LINK_PATTERN.search(data):
         result["warnings"].append({
             "message": "OP-NOTE index doesn't link to any notes"
         })
@@ -110,20 +141,31 @@ def check_reciprocal_links(docs_path: Path, feature_id: Optional[str]) -> Dict[s
     # This is a basic check - full reciprocity checking is complex
     prd_path = docs_path / "prds" / "prd.md"
     if prd_path.exists():
-        prd_content = prd_path.read_text()
+        prd_data = prd_path.read_bytes()
 
         # Check if PRD references specs
-        if "spec-" not in prd_content.lower():
+        if b"spec-" not in prd_data.lower():
             result["warnings"].append({
                 "message": "PRD doesn't reference any specs - consider adding links"
             })
 
     # Check feature file links
     if feature_id:
-        feature_files = list((docs_path / "features").glob(f"ft-{feature_id}*.md"))
-        if feature_files:
-            feature_content = feature_files[0].read_text()
-            if "spec-" not in feature_content.lower():
+        # A prefix/suffix test over one listing; no glob pattern to compile
+        prefix = f"ft-{feature_id}"
+        feature_file = None
+        try:
+            with os.scandir(docs_path / "features") as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.name.endswith(".md") and entry.is_file():
+                        feature_file = Path(entry.path)
+                        break
+        except OSError:
+            pass
+
+        if feature_file:
+            feature_data = feature_file.read_bytes()
+            if b"spec-" not in feature_data.lower():
                 result["warnings"].append({
                     "message": f"Feature ft-{feature_id} doesn't link to specs"
                 })
@@ -133,20 +175,32 @@ def check_reciprocal_links(docs_path: Path, feature_id: Optional[str]) -> Dict[s
 
 def check_git_release_tag(project_root: Path) -> Dict[str, Any]:
     """Check if release is tagged in Git."""
+    import subprocess  # only needed for the tag check
+
     result = {"valid": True, "issues": [], "warnings": [], "tags": []}
 
     try:
-        # Get recent tags
+        # Get recent tags; git stops after the newest five itself
         tags_output = subprocess.run(
-            ["git", "tag", "-l", "--sort=-creatordate"],
+            ["git", "for-each-ref", "--sort=-creatordate", f"--count={RECENT_TAG_COUNT}",
+             "--format=%(refname:lstrip=2)", "refs/tags"],
             cwd=project_root,
             capture_output=True,
             text=True,
             timeout=10
         )
+        if tags_output.returncode != 0:
+            # Git before 2.13 has no lstrip; list every tag and slice below
+            tags_output = subprocess.run(
+                ["git", "tag", "-l", "--sort=-creatordate"],
+                cwd=project_root,
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
 
         if tags_output.returncode == 0:
-            tags = tags_output.stdout.strip().split("\n")[:5]  # Last 5 tags
+            tags = tags_output.stdout.strip().split("\n")[:RECENT_TAG_COUNT]
             result["tags"] = [t for t in tags if t]
 
             if not result["tags"]:
@@ -191,30 +245,35 @@ def validate(project_root: Path, feature_id: Optional[str] = None,
         "details": {}
     }
 
-    # Check spec index
-    spec_result = check_spec_index(docs_path)
-    result["details"]["spec_index"] = spec_result
-    result["warnings"].extend(spec_result.get("warnings", []))
-    if spec_result.get("issues"):
-        result["issues"].extend(spec_result["issues"])
+    # The git subprocess is the only slow check; run it while the docs are read
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        git_future = pool.submit(check_git_release_tag, project_root)
+
+        # Check spec index
+        spec_result = check_spec_index(docs_path)
+        result["details"]["spec_index"] = spec_result
+        result["warnings"].extend(spec_result.get("warnings", []))
+        if spec_result.get("issues"):
+            result["issues"].extend(spec_result["issues"])
+
+        # Check feature schedule
+        schedule_result = check_feature_schedule(docs_path, feature_id)
+        result["details"]["schedule"] = schedule_result
+        result["warnings"].extend(schedule_result.get("warnings", []))
 
-    # Check feature schedule
-    schedule_result = check_feature_schedule(docs_path, feature_id)
-    result["details"]["schedule"] = schedule_result
-    result["warnings"].extend(schedule_result.get("warnings", []))
+        # Check OP-NOTE index
+        opnote_result = check_opnotes_index(docs_path)
+        result["details"]["opnote_index"] = opnote_result
+        result["warnings"].extend(opnote_result.get("warnings", []))
 
-    # Check OP-NOTE index
-    opnote_result = check_opnotes_index(docs_path)
-    result["details"]["opnote_index"] = opnote_result
-    result["warnings"].extend(opnote_result.get("warnings", []))
+        # Check reciprocal links
+        links_result = check_reciprocal_links(docs_path, feature_id)
+        result["details"]["links"] = links_result
+        result["warnings"].extend(links_result.get("warnings", []))
 
-    # Check reciprocal links
-    links_result = check_reciprocal_links(docs_path, feature_id)
-    result["details"]["links"] = links_result
-    result["warnings"].extend(links_result.get("warnings", []))
+        git_result = git_future.result()
 
     # Check Git release tag
-    git_result = check_git_release_tag(project_root)
     result["details"]["git_tags"] = git_result
     result["warnings"].extend(git_result.get("warnings", []))
     if git_result.get("tags"):
@@ -14,9 +14,16 @@ Exit codes:
     2 - Warnings only
 """
 
+import functools
+import os
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# section_body is shared by the skill scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_common"))
+from sections import section_body  # noqa: E402
 
 
 FEATURE_REQUIRED_SECTIONS = [
@@ -36,6 +43,32 @@ FEATURE_REQUIRED_MEDIUM_LARGE = [
     "Dependency",
 ]
 
+# A run of '#' and the whitespace after it; heading text starts at its end
+HEADING_MARKER_PATTERN = re.compile(r"#+\s*")
+
+# Required section names are prefix-tested, so this much text per heading is enough
+HEADING_PREFIX_LEN = max(len(section) for section in FEATURE_REQUIRED_SECTIONS)
+
+# Heading patterns only start at the first '#' of a run. Retrying from every
+# later '#' finds the same match, but makes a long run of '#' quadratic.
+API_DESIGN_PATTERN = re.compile(r"(?<!#)#+\s*API Design\s*\n", re.IGNORECASE)
+# A ':' with a ')' later on its line; stopping at the next ':' keeps the scan linear
+SIGNATURE_PATTERN = re.compile(r"(?:def |function |class |async def |->|:[^:\n]*\))")
+ENDPOINT_PATTERN = re.compile(r"(?:GET|POST|PUT|DELETE|PATCH)\s+/")
+
+# Plain literals, checked with substring tests; the markers against lowercased text
+SIGNATURE_DOC_MARKERS = ("**signature**", "**parameters**", "**returns**", "parameters:", "returns:")
+# "string" and "boolean" are covered by "str" and "bool"
+PARAMETER_TYPE_KEYWORDS = ("str", "int", "float", "bool", "List", "Dict", "Optional", "[]", "number")
+
+ACCEPTANCE_CRITERIA_PATTERN = re.compile(r"(?<!#)#+\s*Acceptance Criteria\s*\n", re.IGNORECASE)
+CHECKLIST_PATTERN = re.compile(r"- \[ \]|\* \[ \]|^\d+\.", re.MULTILINE)
+GHERKIN_PATTERN = re.compile(r"(?:Given|When|Then|And|But)\s+", re.IGNORECASE)
+CRITERION_PATTERN = re.compile(r"(?:- \[ \]|\* \[ \]|^\d+\.|Given\s+)", re.MULTILINE | re.IGNORECASE)
+
+SPEC_REF_PATTERN = re.compile(r"spec-\w+\.md(?:\s*\(v[\d.]+\))?", re.IGNORECASE)
+VERSION_PATTERN = re.compile(r"v[\d.]+")
+
 
 def find_feature_file(docs_path: Path, feature_id: Optional[str]) -> Optional[Path]:
     """Find the feature spec file."""
@@ -43,30 +76,57 @@ def find_feature_file(docs_path: Path, feature_id: Optional[str]) -> Optional[Pa
     if not features_path.exists():
         return None
 
-    if feature_id:
-        # Look for specific feature
-        matches = list(features_path.glob(f"ft-{feature_id}*.md"))
-        if matches:
-            return matches[0]
+    # One listing serves both the ID lookup and the newest-file fallback;
+    # DirEntry.stat() reuses what the directory read already fetched
+    id_prefix = f"ft-{feature_id}" if feature_id else None
+    newest, newest_mtime = None, None
+    with os.scandir(features_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("ft-") and name.endswith(".md")) or not entry.is_file():
+                continue
+            if id_prefix and name.startswith(id_prefix):
+                # Look for specific feature
+                return Path(entry.path)
+            mtime = entry.stat().st_mtime
+            if newest_mtime is None or mtime > newest_mtime:
+                newest, newest_mtime = entry.path, mtime
 
     # Get the most recent feature file
-    feature_files = [f for f in features_path.glob("ft-*.md") if f.name != "schedule.md"]
-    if not feature_files:
-        return None
-
-    return max(feature_files, key=lambda f: f.stat().st_mtime)
-
-
-def check_api_design_section(content: str) -> Dict[str, Any]:
+    return Path(newest) if newest else None
+
+
+def heading_texts(content: str) -> Tuple[List[str], List[str]]:
+    """Lowercased heading text as (starts, lines), from one pass over the document.
+
+    starts holds the first HEADING_PREFIX_LEN characters after every run of
+    '#'; lines holds the rest of the line after the first run on each line.
+    Later runs on a line only see a suffix of that text, so substring tests
+    against lines cover them without rescanning the line once per '#'.
+    """
+    starts = []
+    lines = []
+    line_end = -1
+    for match in HEADING_MARKER_PATTERN.finditer(content):
+        start = match.end()
+        starts.append(content[start:start + HEADING_PREFIX_LEN].lower())
+        if start > line_end:
+            line_end = content.find("\n", start)
+            if line_end == -1:
+                line_end = len(content)
+            lines.append(content[start:line_end].lower())
+    return starts, lines
+
+
+def check_api_design_section(content: str, content_lower: Optional[str] = None) -> Dict[str, Any]:
     """Validate the API Design section has required elements."""
     result = {"valid": True, "issues": [], "warnings": []}
 
-    # Find API Design section
-    api_design_match = re.search(
-        r"#+\s*API Design\s*\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    if content_lower is None:
+        content_lower = content.lower()
+
+    # Find API Design section; the heading literal must be present first
+    api_design_match = API_DESIGN_PATTERN.search(content) if "api design" in content_lower else None
 
     if not api_design_match:
         result["valid"] = False
@@ -76,20 +136,14 @@ def check_api_design_section(content: str) -> Dict[str, Any]:
         })
         return result
 
-    api_section = api_design_match.group(1)
+    api_section = section_body(content, api_design_match)
 
     # Check for function/method signatures
-    has_signatures = bool(re.search(
-        r"(?:def |function |class |async def |->|:.*\))",
-        api_section
-    ))
+    has_signatures = bool(SIGNATURE_PATTERN.search(api_section))
 
     # Check for signature indicators (Signature:, Parameters:, Returns:)
-    has_signature_docs = bool(re.search(
-        r"(?:\*\*Signature\*\*|\*\*Parameters\*\*|\*\*Returns\*\*|Parameters:|Returns:)",
-        api_section,
-        re.IGNORECASE
-    ))
+    api_section_lower = api_section.lower()
+    has_signature_docs = any(marker in api_section_lower for marker in SIGNATURE_DOC_MARKERS)
 
     if not has_signatures and not has_signature_docs:
         result["valid"] = False
@@ -99,14 +153,14 @@ def check_api_design_section(content: str) -> Dict[str, Any]:
         })
 
     # Check for parameter types
-    if not re.search(r"(?:str|int|float|bool|List|Dict|Optional|\[\]|string|number|boolean)", api_section):
+    if not any(keyword in api_section for keyword in PARAMETER_TYPE_KEYWORDS):
         result["warnings"].append({
             "message": "API Design should specify parameter types"
         })
 
     # Check for API endpoint if applicable
-    if "endpoint" in content.lower() or "api" in content.lower():
-        if not re.search(r"(?:GET|POST|PUT|DELETE|PATCH)\s+/", api_section):
+    if "endpoint" in content_lower or "api" in content_lower:
+        if not ENDPOINT_PATTERN.search(api_section):
             result["warnings"].append({
                 "message": "API Design mentions endpoints but no HTTP method/path found"
             })
@@ -114,16 +168,17 @@ def check_api_design_section(content: str) -> Dict[str, Any]:
     return result
 
 
-def check_acceptance_criteria(content: str) -> Dict[str, Any]:
+def check_acceptance_criteria(content: str, content_lower: Optional[str] = None) -> Dict[str, Any]:
     """Validate acceptance criteria are present and testable."""
     result = {"valid": True, "issues": [], "warnings": []}
 
+    if content_lower is None:
+        content_lower = content.lower()
+
     # Find Acceptance Criteria section
-    ac_match = re.search(
-        r"#+\s*Acceptance Criteria\s*\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    ac_match = None
+    if "acceptance criteria" in content_lower:
+        ac_match = ACCEPTANCE_CRITERIA_PATTERN.search(content)
 
     if not ac_match:
         result["valid"] = False
@@ -133,11 +188,11 @@ def check_acceptance_criteria(content: str) -> Dict[str, Any]:
         })
         return result
 
-    ac_section = ac_match.group(1)
+    ac_section = section_body(content, ac_match)
 
     # Check for checklist or Gherkin format
-    has_checklist = bool(re.search(r"- \[ \]|\* \[ \]|^\d+\.", ac_section, re.MULTILINE))
-    has_gherkin = bool(re.search(r"(?:Given|When|Then|And|But)\s+", ac_section, re.IGNORECASE))
+    has_checklist = bool(CHECKLIST_PATTERN.search(ac_section))
+    has_gherkin = bool(GHERKIN_PATTERN.search(ac_section))
 
     if not has_checklist and not has_gherkin:
         result["warnings"].append({
@@ -145,7 +200,7 @@ def check_acceptance_criteria(content: str) -> Dict[str, Any]:
         })
 
     # Count criteria
-    criteria_count = len(re.findall(r"(?:- \[ \]|\* \[ \]|^\d+\.|Given\s+)", ac_section, re.MULTILINE | re.IGNORECASE))
+    criteria_count = len(CRITERION_PATTERN.findall(ac_section))
     if criteria_count < 3:
         result["warnings"].append({
             "message": f"Only {criteria_count} acceptance criteria found - consider adding more"
@@ -154,12 +209,15 @@ def check_acceptance_criteria(content: str) -> Dict[str, Any]:
     return result
 
 
-def check_spec_links(content: str) -> Dict[str, Any]:
+def check_spec_links(content: str, content_lower: Optional[str] = None) -> Dict[str, Any]:
     """Check for links to TECH-SPECs with versions."""
     result = {"valid": True, "issues": [], "warnings": []}
 
+    if content_lower is None:
+        content_lower = content.lower()
+
     # Check for TECH-SPEC references
-    spec_refs = re.findall(r"spec-\w+\.md(?:\s*\(v[\d.]+\))?", content, re.IGNORECASE)
+    spec_refs = SPEC_REF_PATTERN.findall(content) if "spec-" in content_lower else []
 
     if not spec_refs:
         result["valid"] = False
@@ -170,7 +228,7 @@ def check_spec_links(content: str) -> Dict[str, Any]:
         return result
 
     # Check for version numbers
-    versioned_refs = [r for r in spec_refs if re.search(r"v[\d.]+", r)]
+    versioned_refs = [r for r in spec_refs if VERSION_PATTERN.search(r)]
     if len(versioned_refs) < len(spec_refs):
         result["warnings"].append({
             "message": "TECH-SPEC references should include version numbers (e.g., spec-api.md (v1.3))"
@@ -179,21 +237,33 @@ def check_spec_links(content: str) -> Dict[str, Any]:
     return result
 
 
+@functools.lru_cache(maxsize=4)
+def read_schedule(schedule_path: Path, mtime_ns: int, size: int) -> Tuple[str, str]:
+    """schedule.md's text and its lowercased copy.
+
+    Keyed on mtime and size, so validating several features in one process reads the
+    schedule once while an edited schedule is still picked up.
+    """
+    content = schedule_path.read_text()
+    return content, content.lower()
+
+
 def check_schedule_updated(docs_path: Path, feature_id: Optional[str]) -> Dict[str, Any]:
     """Check if schedule.md includes this feature."""
     result = {"valid": True, "issues": [], "warnings": []}
 
     schedule_path = docs_path / "features" / "schedule.md"
-    if not schedule_path.exists():
+    try:
+        st = schedule_path.stat()
+    except OSError:
         result["warnings"].append({
             "message": "docs/features/schedule.md not found - create to track feature status"
         })
         return result
 
-    content = schedule_path.read_text()
-
     if feature_id:
-        if f"ft-{feature_id}" not in content.lower() and feature_id not in content:
+        content, content_lower = read_schedule(schedule_path, st.st_mtime_ns, st.st_size)
+        if f"ft-{feature_id}" not in content_lower and feature_id not in content:
             result["warnings"].append({
                 "message": f"Feature ft-{feature_id} not found in schedule.md"
             })
@@ -230,11 +300,17 @@ def validate(project_root: Path, feature_id: Optional[str] = None,
     result["feature_file"] = str(feature_file.relative_to(project_root))
     content = feature_file.read_text()
 
-    # Check required sections
+    # Lowercase once; each regex below only runs if its literal is present
+    content_lower = content.lower()
+
+    # One pass collects every heading; section checks are string tests on those
+    heading_starts, heading_lines = heading_texts(content)
+
+    # Check required sections (the heading must start with the name)
     missing_sections = []
     for section in FEATURE_REQUIRED_SECTIONS:
-        pattern = rf"#+\s*{re.escape(section)}"
-        if not re.search(pattern, content, re.IGNORECASE):
+        name = section.lower()
+        if not any(heading.startswith(name) for heading in heading_starts):
             missing_sections.append(section)
 
     if missing_sections:
@@ -250,10 +326,11 @@ def validate(project_root: Path, feature_id: Optional[str] = None,
 
     # Check Medium/Large specific sections
     if size_track in ["medium", "large"]:
+        # These may appear anywhere in the heading line
         missing_ml = []
         for section in FEATURE_REQUIRED_MEDIUM_LARGE:
-            pattern = rf"#+\s*.*{re.escape(section)}"
-            if not re.search(pattern, content, re.IGNORECASE):
+            name = section.lower()
+            if not any(name in line for line in heading_lines):
                 missing_ml.append(section)
 
         if missing_ml:
@@ -263,7 +340,7 @@ def validate(project_root: Path, feature_id: Optional[str] = None,
             })
 
     # Validate API Design section
-    api_result = check_api_design_section(content)
+    api_result = check_api_design_section(content, content_lower)
     result["details"]["api_design"] = api_result
     if not api_result["valid"]:
         result["valid"] = False
@@ -274,7 +351,7 @@ def validate(project_root: Path, feature_id: Optional[str] = None,
     result["warnings"].extend([{**w, "file": feature_file.name} for w in api_result.get("warnings", [])])
 
     # Validate Acceptance Criteria
-    ac_result = check_acceptance_criteria(content)
+    ac_result = check_acceptance_criteria(content, content_lower)
     result["details"]["acceptance_criteria"] = ac_result
     if not ac_result["valid"]:
         result["valid"] = False
@@ -285,7 +362,7 @@ def validate(project_root: Path, feature_id: Optional[str] = None,
     result["warnings"].extend([{**w, "file": feature_file.name} for w in ac_result.get("warnings", [])])
 
     # Check SPEC links
-    spec_result = check_spec_links(content)
+    spec_result = check_spec_links(content, content_lower)
     result["details"]["spec_links"] = spec_result
     if not spec_result["valid"]:
         result["valid"] = False
@@ -69,8 +69,9 @@ def check_file_has_sections(file_path: Path, required_sections: List[str]) -> Di
     results = {}
 
     for section in required_sections:
-        # Look for section headers (## Section or # Section)
-        pattern = rf"#+\s*{re.escape(section.lower())}"
+        # Look for section headers (## Section or # Section), starting only at
+        # the first '#' of a run so a long run of '#' isn't rescanned per '#'
+        pattern = rf"(?<!#)#+\s*{re.escape(section.lower())}"
         results[section] = bool(re.search(pattern, content))
 
     return results
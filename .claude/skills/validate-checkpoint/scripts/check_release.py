@@ -14,10 +14,16 @@ Exit codes:
     2 - Warnings only
 """
 
+import os
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# section_body is shared by the skill scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_common"))
+from sections import section_body  # noqa: E402
+
 
 OPNOTE_REQUIRED_SECTIONS = [
     "Preflight",
@@ -28,6 +34,30 @@ OPNOTE_REQUIRED_SECTIONS = [
     "Post-Deploy",
 ]
 
+# A run of '#' and the whitespace after it; heading text starts at its end
+HEADING_MARKER_PATTERN = re.compile(r"#+\s*")
+
+# Required section names are prefix-tested, so this much text per heading is enough
+HEADING_PREFIX_LEN = max(len(section) for section in OPNOTE_REQUIRED_SECTIONS)
+
+# Any one of these literals counts as a header
+HEADER_MARKERS = ("**File**", "**Date**", "**Features**")
+
+# Credentials that must never appear in an OP-NOTE, each with the keyword
+# that has to be present before its pattern is worth running
+SECRET_PATTERNS = [
+    ("password", re.compile(r"password\s*[=:]\s*['\"]?\w+", re.IGNORECASE)),
+    ("api_key", re.compile(r"api_key\s*[=:]\s*['\"]?\w+", re.IGNORECASE)),
+    ("secret", re.compile(r"secret\s*[=:]\s*['\"]?\w+", re.IGNORECASE)),
+    ("token", re.compile(r"token\s*[=:]\s*['\"]?[A-Za-z0-9_-]{20,}", re.IGNORECASE)),
+]
+
+# Only starts at the first '#' of a run; retrying from every later '#' finds
+# the same match, but makes a long run of '#' quadratic
+ROLLBACK_PATTERN = re.compile(r"(?<!#)#+\s*Rollback\s*\n", re.IGNORECASE)
+
+OPNOTE_LINK_PATTERN = re.compile(r"op-\d+|op-release-", re.IGNORECASE)
+
 
 def find_opnote_file(docs_path: Path, feature_id: Optional[str]) -> Optional[Path]:
     """Find the OP-NOTE file."""
@@ -35,23 +65,42 @@ def find_opnote_file(docs_path: Path, feature_id: Optional[str]) -> Optional[Pat
     if not opnotes_path.exists():
         return None
 
-    if feature_id:
-        # Look for feature-specific OP-NOTE
-        matches = list(opnotes_path.glob(f"op-{feature_id}*.md"))
-        if matches:
-            return matches[0]
-
-    # Look for release OP-NOTE
-    release_notes = list(opnotes_path.glob("op-release-*.md"))
-    if release_notes:
-        return max(release_notes, key=lambda f: f.stat().st_mtime)
-
-    # Get any OP-NOTE
-    all_notes = [f for f in opnotes_path.glob("op-*.md") if f.name != "index.md"]
-    if all_notes:
-        return max(all_notes, key=lambda f: f.stat().st_mtime)
-
-    return None
+    # One listing serves the ID lookup and both newest-file fallbacks;
+    # DirEntry.stat() reuses what the directory read already fetched
+    id_prefix = f"op-{feature_id}" if feature_id else None
+    newest_release, newest_release_mtime = None, None
+    newest_note, newest_note_mtime = None, None
+    with os.scandir(opnotes_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("op-") and name.endswith(".md")) or not entry.is_file():
+                continue
+            if id_prefix and name.startswith(id_prefix):
+                # Look for feature-specific OP-NOTE
+                return Path(entry.path)
+            mtime = entry.stat().st_mtime
+            if name.startswith("op-release-") and (newest_release_mtime is None or mtime > newest_release_mtime):
+                newest_release, newest_release_mtime = entry.path, mtime
+            if newest_note_mtime is None or mtime > newest_note_mtime:
+                newest_note, newest_note_mtime = entry.path, mtime
+
+    # Prefer the latest release OP-NOTE, then any OP-NOTE
+    newest = newest_release or newest_note
+    return Path(newest) if newest else None
+
+
+def heading_texts(content: str) -> List[str]:
+    """Lowercased start of the text after every run of '#'.
+
+    One pass over the document; section checks then test these strings
+    instead of each running its own regex over the whole file. Only the first
+    HEADING_PREFIX_LEN characters are kept, so a line holding many runs of
+    '#' isn't copied once per run.
+    """
+    return [
+        content[match.end():match.end() + HEADING_PREFIX_LEN].lower()
+        for match in HEADING_MARKER_PATTERN.finditer(content)
+    ]
 
 
 def validate_opnote(opnote_path: Path) -> Dict[str, Any]:
@@ -60,11 +109,16 @@ def validate_opnote(opnote_path: Path) -> Dict[str, Any]:
 
     content = opnote_path.read_text()
 
-    # Check required sections
+    # Lowercase once; each regex below only runs if its literal is present
+    content_lower = content.lower()
+
+    # Check required sections; one pass collects the headings, and each
+    # section only has to start one of them
+    headings = heading_texts(content)
     missing_sections = []
     for section in OPNOTE_REQUIRED_SECTIONS:
-        pattern = rf"#+\s*{re.escape(section)}"
-        if not re.search(pattern, content, re.IGNORECASE):
+        name = section.lower()
+        if not any(heading.startswith(name) for heading in headings):
             missing_sections.append(section)
 
     if missing_sections:
@@ -75,20 +129,14 @@ def validate_opnote(opnote_path: Path) -> Dict[str, Any]:
         })
 
     # Check for header
-    if not re.search(r"\*\*(?:File|Date|Features)\*\*", content):
+    if not any(marker in content for marker in HEADER_MARKERS):
         result["warnings"].append({
             "message": "OP-NOTE should have header with File, Date, Features"
         })
 
     # Check for secrets (should NOT be present)
-    secret_patterns = [
-        r"password\s*[=:]\s*['\"]?\w+",
-        r"api_key\s*[=:]\s*['\"]?\w+",
-        r"secret\s*[=:]\s*['\"]?\w+",
-        r"token\s*[=:]\s*['\"]?[A-Za-z0-9_-]{20,}",
-    ]
-    for pattern in secret_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
+    for keyword, pattern in SECRET_PATTERNS:
+        if keyword in content_lower and pattern.search(content):
             result["valid"] = False
             result["issues"].append({
                 "severity": "error",
@@ -97,20 +145,16 @@ def validate_opnote(opnote_path: Path) -> Dict[str, Any]:
             break
 
     # Check Preflight section quality
-    if "migration" in content.lower():
-        if "staging" not in content.lower() and "tested" not in content.lower():
+    if "migration" in content_lower:
+        if "staging" not in content_lower and "tested" not in content_lower:
             result["warnings"].append({
                 "message": "OP-NOTE mentions migrations but no staging test noted"
             })
 
     # Check Rollback section quality
-    rollback_match = re.search(
-        r"#+\s*Rollback\s*\n(.*?)(?=\n#[^#]|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL
-    )
+    rollback_match = ROLLBACK_PATTERN.search(content) if "rollback" in content_lower else None
     if rollback_match:
-        rollback_content = rollback_match.group(1)
+        rollback_content = section_body(content, rollback_match)
         if len(rollback_content.strip()) < 50:
             result["warnings"].append({
                 "message": "Rollback section seems too brief - include precise steps"
@@ -130,10 +174,11 @@ def check_spec_reconciliation(docs_path: Path, feature_id: Optional[str]) -> Dic
         for spec_file in spec_files:
             if spec_file.name == "index.md":
                 continue
-            content = spec_file.read_text()
+            # Only ASCII literals are tested, so the bytes needn't be decoded
+            data = spec_file.read_bytes().lower()
 
             # Check for "Last Verified" or version update indicators
-            if "last verified" not in content.lower() and "updated" not in content.lower():
+            if b"last verified" not in data and b"updated" not in data:
                 result["warnings"].append({
                     "file": spec_file.name,
                     "message": "Spec may not have been reconciled - check if implementation matches"
@@ -150,9 +195,9 @@ def check_spec_reconciliation(docs_path: Path, feature_id: Optional[str]) -> Dic
 
         if disco_files:
             disco_file = disco_files[0]
-            content = disco_file.read_text()
+            data = disco_file.read_bytes()
 
-            if "post-implementation" not in content.lower():
+            if b"post-implementation" not in data.lower():
                 result["warnings"].append({
                     "file": disco_file.name,
                     "message": "Discovery document missing Post-Implementation Notes section"
@@ -175,8 +220,7 @@ def check_opnotes_index(docs_path: Path) -> Dict[str, Any]:
     content = index_path.read_text()
 
     # Check for links to OP-NOTEs
-    opnote_links = re.findall(r"op-\d+|op-release-", content, re.IGNORECASE)
-    if not opnote_links:
+    if not OPNOTE_LINK_PATTERN.search(content):
         result["warnings"].append({
             "message": "OP-NOTE index doesn't link to any notes"
         })
@@ -5,11 +5,14 @@ Orchestrates validation across all checkpoints and aggregates results.
 
 Usage:
     python validate_checkpoint.py [checkpoint_number] [--feature-id ID] [--size-track TRACK]
+    python validate_checkpoint.py [checkpoint_number] --all-features [--json]
 
 Arguments:
     checkpoint_number: 1-6 (optional, auto-detects if not provided)
     --feature-id: Feature ID for context (e.g., 030)
     --size-track: micro|small|medium|large (affects required checks)
+    --all-features: Validate every docs/features/ft-*.md spec; with --json,
+                    prints one JSON object per feature per line
 
 Exit codes:
     0 - All validations passed
@@ -18,11 +21,13 @@ Exit codes:
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 
 # Checkpoint definitions
 CHECKPOINTS = {
@@ -45,6 +50,15 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
+def list_dir_names(path: Path) -> Set[str]:
+    """Entry names in a directory, or an empty set if it can't be listed."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
 def detect_current_checkpoint(project_root: Path, feature_id: Optional[str] = None) -> int:
     """
     Auto-detect which checkpoint should be validated based on existing artifacts.
@@ -53,26 +67,27 @@ def detect_current_checkpoint(project_root: Path, feature_id: Optional[str] = No
     """
     docs = project_root / "docs"
 
+    # One listing per directory; every check below is an in-memory name test
+    op_note_names = list_dir_names(docs / "op-notes")
+
     # Check for Checkpoint #6 (already deployed)
-    op_notes_index = docs / "op-notes" / "index.md"
-    if op_notes_index.exists():
-        content = op_notes_index.read_text()
-        if feature_id and f"ft-{feature_id}" in content.lower():
+    if feature_id and "index.md" in op_note_names:
+        data = (docs / "op-notes" / "index.md").read_bytes()
+        if f"ft-{feature_id}".encode() in data.lower():
             # Feature appears in op-notes index, check if deployed
             return 6
 
     # Check for Checkpoint #5 (OP-NOTE exists)
-    op_notes = docs / "op-notes"
-    if op_notes.exists():
-        for f in op_notes.glob("op-*.md"):
-            if f.name != "index.md":
-                return 5  # Has OP-NOTE, validate release ready
+    if any(name.startswith("op-") and name.endswith(".md") for name in op_note_names):
+        return 5  # Has OP-NOTE, validate release ready
+
+    feature_names = list_dir_names(docs / "features")
 
     # Check for Checkpoint #4 (tests should be passing)
     # This requires running tests, so we check for test files
     if feature_id:
-        feature_file = docs / "features" / f"ft-{feature_id}*.md"
-        if list(docs.glob(f"features/ft-{feature_id}*.md")):
+        prefix = f"ft-{feature_id}"
+        if any(name.startswith(prefix) and name.endswith(".md") for name in feature_names):
             # Feature exists, check test status
             # For now, assume we should validate implementation
             return 4
@@ -81,18 +96,30 @@ def detect_current_checkpoint(project_root: Path, feature_id: Optional[str] = No
     # Would need to actually run tests to verify
 
     # Check for Checkpoint #2 (Feature spec exists)
-    features = docs / "features"
-    if features.exists() and list(features.glob("ft-*.md")):
+    if any(name.startswith("ft-") and name.endswith(".md") for name in feature_names):
         return 2
 
-    # Check for Checkpoint #1 (Planning docs exist)
-    if (docs / "prds" / "prd.md").exists():
-        return 1
-
-    # No artifacts found, start from beginning
+    # Checkpoint #1 (planning docs exist, or no artifacts found yet); with
+    # or without docs/prds/prd.md this is where the workflow starts
     return 1
 
 
+@functools.lru_cache(maxsize=None)
+def load_validator(script_path: Path, module_name: str):
+    """Import a checkpoint script, once per process.
+
+    Later runs of the same checkpoint (e.g. for other features) reuse the
+    module instead of executing the script again.
+    """
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    if not (spec and spec.loader):
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def run_checkpoint_validator(checkpoint: int, project_root: Path,
                               feature_id: Optional[str] = None,
                               size_track: str = "medium") -> Dict[str, Any]:
@@ -130,15 +157,11 @@ def run_checkpoint_validator(checkpoint: int, project_root: Path,
 
     # Try to import and run the checkpoint script
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(f"check_{checkpoint}", script_path)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            if hasattr(module, 'validate'):
-                result = module.validate(project_root, feature_id, size_track)
-                result["checkpoint"] = checkpoint
-                result["name"] = cp_info["name"]
+        module = load_validator(script_path, f"check_{checkpoint}")
+        if module and hasattr(module, 'validate'):
+            result = module.validate(project_root, feature_id, size_track)
+            result["checkpoint"] = checkpoint
+            result["name"] = cp_info["name"]
     except FileNotFoundError:
         result["warnings"].append({
             "message": f"Validator script not found: {script_path}"
@@ -157,6 +180,41 @@ def run_checkpoint_validator(checkpoint: int, project_root: Path,
     return result
 
 
+def list_feature_ids(project_root: Path) -> List[str]:
+    """IDs of the docs/features/ft-<id>-*.md specs, in file name order."""
+    feature_ids = []
+    for name in sorted(list_dir_names(project_root / "docs" / "features")):
+        if name.startswith("ft-") and name.endswith(".md"):
+            feature_id = name[len("ft-"):-len(".md")].split("-", 1)[0]
+            if feature_id and feature_id not in feature_ids:
+                feature_ids.append(feature_id)
+    return feature_ids
+
+
+def validate_all_features(project_root: Path, checkpoint: Optional[int] = None,
+                          size_track: str = "medium") -> List[Dict[str, Any]]:
+    """Validate every feature spec, each on a worker thread.
+
+    Without a checkpoint number, each feature's checkpoint is auto-detected.
+    Results come back in feature ID order, tagged with their feature_id.
+    """
+    def run(feature_id: str) -> Dict[str, Any]:
+        feature_checkpoint = checkpoint
+        if feature_checkpoint is None:
+            feature_checkpoint = detect_current_checkpoint(project_root, feature_id)
+        result = run_checkpoint_validator(feature_checkpoint, project_root, feature_id, size_track)
+        result["feature_id"] = feature_id
+        return result
+
+    feature_ids = list_feature_ids(project_root)
+    if not feature_ids:
+        return []
+
+    workers = min(32, len(feature_ids), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, feature_ids))
+
+
 def generate_summary(result: Dict[str, Any]) -> str:
     """Generate a human-readable summary of validation results."""
     checkpoint = result.get("checkpoint", "?")
@@ -181,7 +239,10 @@ def generate_summary(result: Dict[str, Any]) -> str:
 def main():
     parser = argparse.ArgumentParser(description="Validate VibeFlow workflow checkpoint")
     parser.add_argument("checkpoint", type=int, nargs="?", help="Checkpoint number (1-6)")
-    parser.add_argument("--feature-id", "-f", help="Feature ID (e.g., 030)")
+    features = parser.add_mutually_exclusive_group()
+    features.add_argument("--feature-id", "-f", help="Feature ID (e.g., 030)")
+    features.add_argument("--all-features", "-a", action="store_true",
+                          help="Validate every feature spec in docs/features/")
     parser.add_argument("--size-track", "-s", choices=["micro", "small", "medium", "large"],
                         default="medium", help="Size track for the change")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
@@ -195,6 +256,25 @@ def main():
     else:
         project_root = find_project_root()
 
+    if args.all_features:
+        results = validate_all_features(project_root, args.checkpoint, args.size_track)
+        if not results and not args.json:
+            print("No feature specs found in docs/features/")
+        for result in results:
+            if args.json:
+                # One object per line (JSON Lines) rather than one large document
+                print(json.dumps(result, default=str), flush=True)
+            else:
+                print(f"ft-{result['feature_id']}: {result['summary']}")
+
+        # Exit code
+        if not results or not all(result["valid"] for result in results):
+            sys.exit(1)
+        elif any(result["warnings"] for result in results):
+            sys.exit(2)
+        else:
+            sys.exit(0)
+
     # Auto-detect checkpoint if not provided
     checkpoint = args.checkpoint
     if checkpoint is None:
@@ -0,0 +1,114 @@
+"""
+Shared helper: find the project root and current branch without forking git.
+
+get_project_root() walks up from the working directory looking for `.git`;
+get_current_branch() reads HEAD directly. Both fall back to the git CLI
+when the filesystem lookup fails, and memoize per process.
+get_git_context() returns both, with a single combined git call as its
+fallback. Fallback git calls give up after GIT_TIMEOUT and are treated as
+"not a repository" rather than stalling the hook.
+"""
+
+import os
+
+# Ceiling for fallback git calls; a healthy local git answers well within it
+GIT_TIMEOUT = 0.5
+
+_cache = {}
+
+
+def _run_git(args, cwd=None):
+    """Return git's stdout, or "" if it fails to start or runs past GIT_TIMEOUT."""
+    import subprocess  # only needed on the fallback path
+
+    try:
+        proc = subprocess.Popen(
+            ["git", *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, cwd=cwd
+        )
+    except OSError:
+        return ""
+    try:
+        return proc.communicate(timeout=GIT_TIMEOUT)[0]
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.stdout.close()  # don't wait on children still holding the pipe
+        proc.wait()
+        return ""
+
+
+def _git_dir(project_root):
+    """Resolve the git dir, following a `gitdir:` file for worktrees."""
+    dot_git = os.path.join(project_root, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    with open(dot_git, "r") as f:
+        content = f.read().strip()
+    if not content.startswith("gitdir:"):
+        raise OSError(f"unrecognized .git file in {project_root}")
+    return os.path.normpath(os.path.join(project_root, content[len("gitdir:"):].strip()))
+
+
+def _find_root(path):
+    """Return the nearest ancestor of path containing `.git`, or ""."""
+    while True:
+        if os.path.exists(os.path.join(path, ".git")):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return ""
+        path = parent
+
+
+def get_project_root():
+    cwd = os.getcwd()
+    key = ("root", cwd)
+    if key in _cache:
+        return _cache[key]
+
+    root = _find_root(cwd)
+    if not root:
+        root = _run_git(["rev-parse", "--show-toplevel"]).strip()
+
+    _cache[key] = root
+    return root
+
+
+def get_current_branch(project_root):
+    """Return the checked-out branch name, or "" when HEAD is detached."""
+    key = ("branch", project_root)
+    if key in _cache:
+        return _cache[key]
+
+    try:
+        with open(os.path.join(_git_dir(project_root), "HEAD"), "r") as f:
+            head = f.read().strip()
+        branch = head[len("ref: refs/heads/"):] if head.startswith("ref: refs/heads/") else ""
+    except OSError:
+        branch = _run_git(["branch", "--show-current"], cwd=project_root).strip()
+
+    _cache[key] = branch
+    return branch
+
+
+def get_git_context():
+    """Return (project_root, branch); branch is "" when HEAD is detached.
+
+    When the filesystem lookup can't find the repository, one
+    `git rev-parse --show-toplevel --abbrev-ref HEAD` call resolves both.
+    """
+    cwd = os.getcwd()
+    key = ("root", cwd)
+    root = _cache[key] if key in _cache else _find_root(cwd)
+    if root:
+        _cache[key] = root
+        return root, get_current_branch(root)
+
+    lines = _run_git(["rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"]).splitlines()
+    root = lines[0].strip() if lines else ""
+    branch = lines[1].strip() if len(lines) > 1 else ""
+    if branch == "HEAD":
+        branch = ""  # detached
+    _cache[key] = root
+    _cache[("branch", root)] = branch
+    return root, branch
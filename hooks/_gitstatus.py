@@ -0,0 +1,59 @@
+"""
+Shared helper: list changed doc files with one pathspec-limited `git status`.
+
+The pathspec keeps git's index refresh, stat pass and untracked-file walk
+inside the requested docs/ subdirectories, and NUL-separated output is
+parsed as it streams in. Staged, unstaged and untracked changes are all
+reported, with git's own .gitignore handling.
+"""
+
+import subprocess
+
+STATUS_TIMEOUT = 5
+
+
+def _iter_nul_records(stream):
+    """Yield NUL-terminated records from a pipe without buffering it all."""
+    pending = b""
+    for chunk in iter(lambda: stream.read1(65536), b""):
+        *records, pending = (pending + chunk).split(b"\0")
+        yield from records
+    if pending:
+        yield pending
+
+
+def changed_doc_files(project_root, dirs):
+    """Return project-relative paths of changed and untracked files under dirs.
+
+    The pathspec limits git's walk and stat traffic to dirs, and -z output
+    keeps paths with spaces or quotes intact. core.fscache speeds up the
+    stat pass on Windows and is ignored elsewhere. Output is parsed as it
+    streams in rather than captured whole.
+    """
+    import threading  # only needed to enforce the timeout
+
+    args = ["git", "-c", "core.fscache=true", "status", "--porcelain=v1", "-z",
+            "--untracked-files=all", "--", *dirs]
+    proc = subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=project_root
+    )
+    timer = threading.Timer(STATUS_TIMEOUT, proc.kill)
+    timer.start()
+    # A path can appear twice, e.g. a staged delete that is untracked again
+    paths = {}
+    try:
+        records = _iter_nul_records(proc.stdout)
+        for record in records:
+            if len(record) < 4:
+                continue
+            # "XY path"; renames and copies are followed by the original path
+            paths[record[3:].decode("utf-8", "surrogateescape")] = None
+            if record[0:1] in (b"R", b"C"):
+                next(records, None)
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode < 0:
+        raise subprocess.TimeoutExpired(args, STATUS_TIMEOUT)
+    return list(paths)
@@ -0,0 +1,209 @@
+"""
+Shared helper: parse the workitems block of docs/workflow-state.yaml.
+
+Understands just the subset of YAML the manifest uses (no external deps):
+
+workitems:
+  <slug>:
+    <field>: <scalar>
+    docs:
+      <field>: <scalar>
+      <field>:
+        - <item>
+
+Parsing is a single compiled-regex scan over the workitems block that only
+visits key and list-item lines. The file is mmap'd and searched as bytes; only the
+workitems block (or a single item's block) is decoded and parsed. Parsed
+results are memoized in-process on (inode, mtime_ns, size); nothing is
+written to disk, keeping hooks read-only. A manifest modified within the
+last RACY_WINDOW_NS is always re-parsed, since a same-size edit inside one
+mtime tick would leave that key unchanged.
+"""
+
+import contextlib
+import functools
+import mmap
+import os
+import re
+import time
+
+
+# Stage -> checkpoint mapping (checkpoint required BEFORE advancing past this stage)
+STAGE_CHECKPOINT = {
+    "D": 1,  # Planning Complete
+    "E": 2,  # Design Complete
+    "F": 3,  # Tests Complete
+    "H": 4,  # Implementation Complete
+    "J": 5,  # Release Ready
+    "L": 6,  # Deployed
+}
+
+# Filesystem mtime granularity can be as coarse as 2s (FAT); a manifest
+# modified this recently may change again without its stat key changing
+RACY_WINDOW_NS = 2_000_000_000
+
+_WORKITEMS_RE = re.compile(r"^workitems:[ \t]*\r?$", re.M)
+_TOP_LEVEL_RE = re.compile(r"^[^\s#]", re.M)
+# One alternative per nesting level; blank and comment lines never match
+_LINE_RE = re.compile(
+    r"^  (?:"
+    r"([^\s#:][^:\n]*):"           # 1: work item slug
+    r"|  (?:"
+    r"([^\s#:][^:\n]*):(.*)"       # 2, 3: item field
+    r"|  (?:"
+    r"([^\s#:\-][^:\n]*):(.*)"     # 4, 5: docs field
+    r"| *-(.*)"                    # 6: docs list item
+    r")))",
+    re.M,
+)
+
+
+def _unquote(value):
+    return value.strip().strip('"').strip("'")
+
+
+def parse_workitems(content):
+    """Return {slug: {field: value, "docs": {field: value | [items]}}}."""
+    workitems = {}
+    header = _WORKITEMS_RE.search(content)
+    if header is None:
+        return workitems
+    next_key = _TOP_LEVEL_RE.search(content, header.end())
+    block_end = next_key.start() if next_key else len(content)
+
+    item = None
+    docs = None
+    list_items = None
+    for slug, key, value, doc_key, doc_value, list_item in _LINE_RE.findall(
+        content[header.end():block_end]
+    ):
+        if slug:
+            item = workitems[_unquote(slug)] = {}
+            docs = list_items = None
+        elif key:
+            list_items = None
+            if item is None:
+                continue
+            key = key.strip()
+            if key == "docs":
+                docs = item["docs"] = {}
+            else:
+                docs = None
+                item[key] = _unquote(value)
+        elif doc_key:
+            list_items = None
+            if docs is None:
+                continue
+            doc_key = doc_key.strip()
+            doc_value = doc_value.strip()
+            if doc_value and doc_value != "[]":
+                docs[doc_key] = _unquote(doc_value)
+            else:
+                docs[doc_key] = []
+                if not doc_value:
+                    list_items = docs[doc_key]
+        elif list_items is not None:
+            list_items.append(_unquote(list_item))
+
+    return workitems
+
+
+@contextlib.contextmanager
+def _mapped(manifest_path):
+    """Yield a read-only mmap of the manifest (b"" when it is empty)."""
+    with open(manifest_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            yield buf
+
+
+def _block_end(buf, pos, end, max_indent):
+    """Offset of the first line after pos (and before end) indented at most
+    max_indent, skipping blank and comment lines; end if there is none."""
+    pos = buf.find(b"\n", pos, end)
+    while pos >= 0:
+        line_start = pos + 1
+        head = buf[line_start:line_start + max_indent + 1].lstrip(b" ")
+        if head[:1] not in (b"", b"\n", b"\r", b"#"):
+            return line_start
+        pos = buf.find(b"\n", line_start, end)
+    return end
+
+
+def _workitems_span(buf):
+    """Return (start, end) offsets of the workitems block, or None."""
+    if buf[:10] == b"workitems:":
+        start = 0
+    else:
+        start = buf.find(b"\nworkitems:")
+        if start < 0:
+            return None
+        start += 1
+    return start, _block_end(buf, start, len(buf), 0)
+
+
+def _decode(buf, start, end):
+    return buf[start:end].decode("utf-8", "replace")
+
+
+def _lookup(workitems, key):
+    if key in workitems:
+        return key, workitems[key]
+    for slug, item in workitems.items():
+        if item.get("id") == key:
+            return slug, item
+    return None, None
+
+
+def find_workitem(manifest_path, key):
+    """Return (slug, item) for the work item whose slug or id is key.
+
+    Locates the `  <slug>:` header with a byte search over the mmap'd file and decodes
+    and parses only that block, falling back to parsing the whole workitems
+    block for id lookups. Returns (None, None) if nothing matches.
+    """
+    with _mapped(manifest_path) as buf:
+        span = _workitems_span(buf)
+        if span is None:
+            return None, None
+        start, end = span
+
+        needle = f"\n  {key}:".encode()
+        idx = buf.find(needle, start, end)
+        while idx >= 0:
+            after = buf[idx + len(needle):idx + len(needle) + 1]
+            if after in (b"", b"\n", b" ", b"\r"):
+                break
+            idx = buf.find(needle, idx + 1, end)
+        if idx >= 0:
+            block_end = _block_end(buf, idx + 1, end, 2)
+            items = parse_workitems("workitems:" + _decode(buf, idx, block_end))
+            if key in items:
+                return key, items[key]
+
+        workitems = parse_workitems(_decode(buf, start, end))
+
+    return _lookup(workitems, key)
+
+
+def _parse_file(manifest_path):
+    with _mapped(manifest_path) as buf:
+        span = _workitems_span(buf)
+        if span is None:
+            return {}
+        return parse_workitems(_decode(buf, *span))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cached(manifest_path, ino, mtime_ns, size):
+    return _parse_file(manifest_path)
+
+
+def load_workitems(manifest_path):
+    """Parse the manifest's workitems, reusing the result while it's unchanged."""
+    st = os.stat(manifest_path)
+    if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+        return _parse_file(manifest_path)
+    return _load_cached(manifest_path, st.st_ino, st.st_mtime_ns, st.st_size)
@@ -6,35 +6,65 @@ Scans git status for changed doc files, runs the matching validation
 script for each, and outputs a consolidated report. Deduplicates so
 each validator runs at most once even if multiple matching files changed.
 
-Input: JSON on stdin with stop_reason (ignored)
+Input: JSON on stdin with stop_reason (ignored, not read)
 Output: Plain text feedback (non-blocking)
 """
 
 import json
 import os
-import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _gitroot import get_project_root
+from _gitstatus import changed_doc_files
+
+# docs/<subdir> → (filename prefix, validator script, doc type label)
+DOC_VALIDATORS = {
+    "prds":      ("prd",    "check_planning.py", "PRD"),
+    "discovery": ("disco-", "check_planning.py", "Discovery"),
+    "specs":     ("spec-",  "check_planning.py", "Tech Spec"),
+    "adrs":      ("adr-",   "check_planning.py", "ADR"),
+    "features":  ("ft-",    "check_design.py", "Feature Spec"),
+    "op-notes":  ("op-",    "check_release.py", "OP-NOTE"),
+}
+
+# Directories with validators; narrows the changed-file scan
+DOC_DIRS = tuple(f"docs/{subdir}" for subdir in DOC_VALIDATORS)
+
+
+def match_doc_validator(rel_path):
+    """Return (script, doc_type) for a doc path, else None."""
+    parts = rel_path.split("/", 2)
+    if len(parts) < 3 or parts[0] != "docs" or not parts[2].endswith(".md"):
+        return None
+    entry = DOC_VALIDATORS.get(parts[1])
+    if entry and parts[2].startswith(entry[0]):
+        return entry[1], entry[2]
+    return None
+
+
+def run_validator(script_path, project_root):
+    """Run one validator with --json and return its parsed report, or None."""
+    try:
+        val_result = subprocess.run(
+            ["uv", "run", "--no-project", script_path, "--json", "--project-root", project_root],
+            capture_output=True, text=True, timeout=15,
+            cwd=project_root
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    if not val_result.stdout.strip():
+        return None
+    try:
+        return json.loads(val_result.stdout)
+    except json.JSONDecodeError:
+        return None
 
-# Pattern → (validator script, doc type label)
-DOC_PATTERNS = [
-    (r"^docs/prds/prd.*\.md$", "check_planning.py", "PRD"),
-    (r"^docs/discovery/disco-.*\.md$", "check_planning.py", "Discovery"),
-    (r"^docs/specs/spec-.*\.md$", "check_planning.py", "Tech Spec"),
-    (r"^docs/adrs/adr-.*\.md$", "check_planning.py", "ADR"),
-    (r"^docs/features/ft-.*\.md$", "check_design.py", "Feature Spec"),
-    (r"^docs/op-notes/op-.*\.md$", "check_release.py", "OP-NOTE"),
-]
 
 try:
-    # Consume stdin (ignored)
-    sys.stdin.read()
-
     # Find project root
-    project_root = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, timeout=5
-    ).stdout.strip()
+    project_root = get_project_root()
 
     if not project_root:
         sys.exit(0)
@@ -48,64 +78,54 @@ try:
             hook_dir, "..", "skills", "validate-checkpoint", "scripts"
         ))
 
-    # Collect changed files (modified + staged + untracked)
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True, text=True, timeout=5,
-        cwd=project_root
-    )
-    if not result.stdout.strip():
+    # Collect changed doc files (modified + untracked) from a docs-limited git status
+    changed_files = changed_doc_files(project_root, DOC_DIRS)
+    if not changed_files:
         sys.exit(0)
 
-    changed_files = []
-    for line in result.stdout.strip().split("\n"):
-        if line:
-            # porcelain format: XY filename  (or XY -> renamed)
-            parts = line.split()
-            if parts:
-                changed_files.append(parts[-1])
-
     # Match files to validators, deduplicating by (script, doc_type)
     validators_to_run = {}  # (script, doc_type) → True
     for filepath in changed_files:
         # Normalize to forward slashes for pattern matching
         normalized = filepath.replace(os.sep, "/")
-        for pattern, script, doc_type in DOC_PATTERNS:
-            if re.match(pattern, normalized):
-                validators_to_run[(script, doc_type)] = True
-                break
+        validator = match_doc_validator(normalized)
+        if validator:
+            validators_to_run[validator] = True
 
     if not validators_to_run:
         sys.exit(0)
 
-    # Run each unique validator once and collect results
+    # Run each unique validator script once, concurrently. Several doc types
+    # share a script (check_planning.py), so they share its result.
+    scripts = {
+        script for script, _ in validators_to_run
+        if os.path.isfile(os.path.join(scripts_dir, script))
+    }
+    if not scripts:
+        sys.exit(0)
+
+    with ThreadPoolExecutor(max_workers=len(scripts)) as pool:
+        futures = {
+            script: pool.submit(run_validator, os.path.join(scripts_dir, script), project_root)
+            for script in scripts
+        }
+        results = {script: future.result() for script, future in futures.items()}
+
     report_lines = []
     for (script, doc_type) in sorted(validators_to_run.keys(), key=lambda x: x[1]):
-        script_path = os.path.join(scripts_dir, script)
-        if not os.path.isfile(script_path):
+        data = results.get(script)
+        if not data:
             continue
 
-        try:
-            val_result = subprocess.run(
-                ["uv", "run", "--no-project", script_path, "--json", "--project-root", project_root],
-                capture_output=True, text=True, timeout=15,
-                cwd=project_root
-            )
-            if not val_result.stdout.strip():
-                continue
-
-            data = json.loads(val_result.stdout)
-            issues = len(data.get("issues", []))
-            warnings = len(data.get("warnings", []))
-
-            if issues == 0 and warnings == 0:
-                report_lines.append(f"  {doc_type}: PASS")
-            elif issues == 0:
-                report_lines.append(f"  {doc_type}: PASS ({warnings} warnings)")
-            else:
-                report_lines.append(f"  {doc_type}: {issues} issues, {warnings} warnings")
-        except (json.JSONDecodeError, subprocess.TimeoutExpired):
-            continue
+        issues = len(data.get("issues", []))
+        warnings = len(data.get("warnings", []))
+
+        if issues == 0 and warnings == 0:
+            report_lines.append(f"  {doc_type}: PASS")
+        elif issues == 0:
+            report_lines.append(f"  {doc_type}: PASS ({warnings} warnings)")
+        else:
+            report_lines.append(f"  {doc_type}: {issues} issues, {warnings} warnings")
 
     if report_lines:
         print("[VibeFlow] Doc validation:")
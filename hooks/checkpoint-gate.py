@@ -12,47 +12,44 @@ Output: JSON on stdout with decision (allow/block) and reason
 
 import json
 import os
-import subprocess
+import re
 import sys
 
-# Stage -> checkpoint mapping (checkpoint required BEFORE advancing past this stage)
-STAGE_CHECKPOINT = {
-    "D": 1,  # Planning Complete
-    "E": 2,  # Design Complete
-    "F": 3,  # Tests Complete
-    "H": 4,  # Implementation Complete
-    "J": 5,  # Release Ready
-    "L": 6,  # Deployed
-}
+# Pre-encoded response for the common allow path
+ALLOW = '{"decision":"allow"}'
+
+# Whole-word "advance"/"close", matched without lowercasing the whole prompt
+TRIGGER_PATTERN = re.compile(r"\b(advance|close)\b", re.IGNORECASE)
 
 try:
-    hook_input = json.loads(sys.stdin.read())
+    hook_input = json.loads(sys.stdin.buffer.read())
     user_message = hook_input.get("user_message", "")
 
     # Fast-path: if prompt doesn't contain "advance" or "close", allow immediately
-    message_lower = user_message.lower()
-    if "advance" not in message_lower and "close" not in message_lower:
-        print(json.dumps({"decision": "allow"}))
+    if not TRIGGER_PATTERN.search(user_message):
+        print(ALLOW)
         sys.exit(0)
 
+    # Imported here so the fast path above stays cheap
+    from _gitroot import get_project_root
+    from _manifest import STAGE_CHECKPOINT, find_workitem
+
     # Find project root
-    project_root = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, timeout=5
-    ).stdout.strip()
+    project_root = get_project_root()
 
     if not project_root:
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     manifest_path = os.path.join(project_root, "docs", "workflow-state.yaml")
     if not os.path.exists(manifest_path):
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     # Determine if this looks like a manage-work advance or close command
-    is_advance = "advance" in message_lower
-    is_close = "close" in message_lower
+    triggers = {word.lower() for word in TRIGGER_PATTERN.findall(user_message)}
+    is_advance = "advance" in triggers
+    is_close = "close" in triggers
 
     # Try to extract a work item ID from the message
     # Look for patterns like "advance 030", "close add-feature", etc.
@@ -68,70 +65,19 @@ try:
 
     if not work_item_id:
         # Can't determine which work item — allow and let the skill handle it
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     # Read manifest to find current stage
-    with open(manifest_path, "r") as f:
-        content = f.read()
-
-    in_workitems = False
-    current_slug = None
-    current_stage = None
-    current_checkpoint = 0
-    current_id = None
-    matched_stage = None
-    matched_checkpoint = None
-    matched_slug = None
-
-    for line in content.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("#"):
-            continue
-        if stripped == "workitems:":
-            in_workitems = True
-            continue
-        if not in_workitems:
-            continue
-
-        if line.startswith("  ") and not line.startswith("    ") and ":" in stripped:
-            # Check previous item
-            if current_slug:
-                if current_slug == work_item_id or str(current_id) == work_item_id:
-                    matched_stage = current_stage
-                    matched_checkpoint = current_checkpoint
-                    matched_slug = current_slug
-
-            key = stripped.split(":")[0].strip()
-            if key and not key.startswith("#"):
-                current_slug = key
-                current_stage = None
-                current_checkpoint = 0
-                current_id = None
-            else:
-                current_slug = None
-            continue
-
-        if current_slug and line.startswith("    ") and not line.startswith("      "):
-            if stripped.startswith("stage:"):
-                current_stage = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-            elif stripped.startswith("checkpoint:"):
-                try:
-                    current_checkpoint = int(stripped.split(":", 1)[1].strip())
-                except ValueError:
-                    current_checkpoint = 0
-            elif stripped.startswith("id:"):
-                current_id = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-
-    # Check last item
-    if current_slug:
-        if current_slug == work_item_id or str(current_id) == work_item_id:
-            matched_stage = current_stage
-            matched_checkpoint = current_checkpoint
-            matched_slug = current_slug
+    matched_slug, item = find_workitem(manifest_path, work_item_id)
+    matched_stage = item.get("stage") if item else None
+    try:
+        matched_checkpoint = int(item.get("checkpoint", 0)) if item else 0
+    except ValueError:
+        matched_checkpoint = 0
 
     if not matched_stage:
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     # For close command: require checkpoint #4 (stage H or later)
@@ -140,9 +86,9 @@ try:
             print(json.dumps({
                 "decision": "block",
                 "reason": f"[VibeFlow] Cannot close '{matched_slug}' — Checkpoint #4 (Implementation Complete) not passed. Current checkpoint: #{matched_checkpoint}. Complete stages through H first."
-            }))
+            }, separators=(",", ":")))
             sys.exit(0)
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     # For advance: check if current stage requires a checkpoint
@@ -162,6 +108,8 @@ try:
                 ))
 
             if os.path.exists(validator_path):
+                import subprocess
+
                 result = subprocess.run(
                     ["uv", "run", "--no-project", validator_path, str(required_cp), "--json",
                      "--project-root", project_root],
@@ -180,11 +128,11 @@ try:
                     print(json.dumps({
                         "decision": "block",
                         "reason": f"[VibeFlow] Cannot advance '{matched_slug}' past Stage {matched_stage} — {summary}. Run '/validate-checkpoint {required_cp}' for details."
-                    }))
+                    }, separators=(",", ":")))
                     sys.exit(0)
 
-    print(json.dumps({"decision": "allow"}))
+    print(ALLOW)
 
 except Exception:
     # Fail open
-    print(json.dumps({"decision": "allow"}))
+    print(ALLOW)
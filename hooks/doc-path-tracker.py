@@ -17,195 +17,85 @@ Pattern -> field mapping:
 
 Fails open: prints warning on error, always exits 0.
 
-Input: JSON on stdin with stop_reason (ignored)
+Input: JSON on stdin with stop_reason (ignored, not read)
 Output: Informational warnings on stdout (never blocks)
 """
 
 import json
 import os
-import re
-import subprocess
 import sys
 
+from _gitroot import get_current_branch, get_project_root
+from _gitstatus import changed_doc_files
+from _manifest import load_workitems
 
-# Pattern -> (field_name, is_list)
-DOC_PATTERNS = [
-    (r"docs/prds/prd.*\.md$",          "prd",       False),
-    (r"docs/discovery/disco-.*\.md$",   "discovery", False),
-    (r"docs/specs/spec-.*\.md$",        "specs",     True),
-    (r"docs/adrs/adr-.*\.md$",          "adrs",      True),
-    (r"docs/features/ft-.*\.md$",       "feature",   False),
-    (r"docs/op-notes/op-.*\.md$",       "opnote",    False),
-]
 
+# docs/<subdir> -> (field_name, is_list, filename prefix)
+DOC_PATTERNS = {
+    "prds":      ("prd",       False, "prd"),
+    "discovery": ("discovery", False, "disco-"),
+    "specs":     ("specs",     True,  "spec-"),
+    "adrs":      ("adrs",      True,  "adr-"),
+    "features":  ("feature",   False, "ft-"),
+    "op-notes":  ("opnote",    False, "op-"),
+}
 
-def get_project_root():
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, timeout=5
-    )
-    return result.stdout.strip()
-
-
-def get_current_branch(project_root):
-    result = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True, text=True, timeout=5,
-        cwd=project_root
-    )
-    return result.stdout.strip()
-
-
-def get_changed_files(project_root):
-    """Get all changed files from git status --porcelain."""
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True, text=True, timeout=5,
-        cwd=project_root
-    )
-    if not result.stdout.strip():
-        return []
-    return [line.split()[-1] for line in result.stdout.strip().split("\n") if line.strip()]
+# Directories DOC_PATTERNS can match; narrows the changed-file scan
+DOC_DIRS = tuple(f"docs/{subdir}" for subdir in DOC_PATTERNS)
 
 
 def match_doc_pattern(rel_path):
     """Return (field_name, is_list) if path matches a doc pattern, else None."""
-    normalized = rel_path.replace("\\", "/")
-    for pattern, field, is_list in DOC_PATTERNS:
-        if re.search(pattern, normalized):
-            return field, is_list
+    parts = rel_path.replace("\\", "/").split("/", 2)
+    if len(parts) < 3 or parts[0] != "docs" or not parts[2].endswith(".md"):
+        return None
+    entry = DOC_PATTERNS.get(parts[1])
+    if entry and parts[2].startswith(entry[2]):
+        return entry[0], entry[1]
     return None
 
 
-def find_active_workitem_for_branch(lines, current_branch):
+def find_active_workitem_for_branch(workitems, current_branch):
     """Find the work item slug whose branch matches current_branch.
 
-    Returns (slug, start_line_index) or (None, None).
+    Returns the slug or None. Branches following the default feat/<slug>
+    convention are resolved with a direct lookup before scanning.
     """
-    in_workitems = False
-    current_slug = None
-    current_slug_start = None
-    current_stage = None
-    current_branch_field = None
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("#"):
-            continue
-        if stripped == "workitems:":
-            in_workitems = True
-            continue
-        if not in_workitems:
-            continue
-
-        # Detect work item key (2-space indent, not 4)
-        if line.startswith("  ") and not line.startswith("    ") and ":" in stripped:
-            # Check previous item
-            if current_slug:
-                branch = current_branch_field or f"feat/{current_slug}"
-                if branch == current_branch and current_stage != "DONE":
-                    return current_slug, current_slug_start
-
-            key = stripped.split(":")[0].strip()
-            if key and not key.startswith("#"):
-                current_slug = key
-                current_slug_start = i
-                current_stage = None
-                current_branch_field = None
-            else:
-                current_slug = None
-                current_slug_start = None
-            continue
-
-        if current_slug and line.startswith("    ") and not line.startswith("      "):
-            if stripped.startswith("stage:"):
-                current_stage = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-            elif stripped.startswith("branch:"):
-                current_branch_field = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-
-    # Check last item
-    if current_slug:
-        branch = current_branch_field or f"feat/{current_slug}"
-        if branch == current_branch and current_stage != "DONE":
-            return current_slug, current_slug_start
-
-    return None, None
+    if current_branch.startswith("feat/"):
+        slug = current_branch[len("feat/"):]
+        item = workitems.get(slug)
+        if (item is not None and (item.get("branch") or current_branch) == current_branch
+                and item.get("stage") != "DONE"):
+            return slug
+
+    for slug, item in workitems.items():
+        branch = item.get("branch") or f"feat/{slug}"
+        if branch == current_branch and item.get("stage") != "DONE":
+            return slug
+    return None
 
 
-def read_docs_fields(lines, slug_start):
-    """Read the docs section for a work item and return current field values.
+def read_docs_fields(item):
+    """Return the work item's docs.* values.
 
     Returns dict: {field_name: value} for scalar fields,
     and {field_name: [values]} for list fields.
     """
-    docs_fields = {}
-
-    # Find the 'docs:' line within this work item's block
-    i = slug_start + 1
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-
-        # Stop if we hit another work item key (2-space indent, not 4)
-        if line.startswith("  ") and not line.startswith("    ") and stripped and ":" in stripped and not stripped.startswith("#"):
-            break
-
-        if line.startswith("    ") and not line.startswith("      ") and stripped == "docs:":
-            i += 1
-            break
-        i += 1
-    else:
-        return docs_fields
-
-    # Parse fields under docs: (6-space indent)
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-
-        # Stop if we leave the docs block
-        if not line.startswith("      ") and stripped:
-            if line.startswith("    ") or (line.startswith("  ") and not line.startswith("    ")):
-                break
-
-        if line.startswith("      ") and not line.startswith("        ") and ":" in stripped:
-            field_name = stripped.split(":")[0].strip()
-            field_value = stripped.split(":", 1)[1].strip()
-
-            if field_name in ("specs", "adrs"):
-                # List field - collect items
-                existing = []
-                j = i + 1
-                while j < len(lines):
-                    list_line = lines[j]
-                    list_stripped = list_line.strip()
-                    if list_line.startswith("        - "):
-                        val = list_stripped.lstrip("- ").strip().strip('"').strip("'")
-                        existing.append(val)
-                        j += 1
-                    else:
-                        break
-                docs_fields[field_name] = existing
-            else:
-                # Scalar field
-                val = field_value.strip('"').strip("'")
-                docs_fields[field_name] = val
-
-        i += 1
-
+    docs_fields = dict(item.get("docs", {}))
+    for field_name, is_list, _ in DOC_PATTERNS.values():
+        if field_name in docs_fields and isinstance(docs_fields[field_name], list) != is_list:
+            docs_fields[field_name] = [] if is_list else ""
     return docs_fields
 
 
 try:
-    # Drain stdin (Stop hook sends JSON but we don't need it)
-    sys.stdin.read()
-
     # Get project root
     project_root = get_project_root()
     if not project_root:
         sys.exit(0)
 
-    # Discover all changed doc files via git status
-    changed_files = get_changed_files(project_root)
+    # Discover all changed doc files via a docs-limited git status
+    changed_files = changed_doc_files(project_root, DOC_DIRS)
     if not changed_files:
         sys.exit(0)
 
@@ -224,22 +114,19 @@ try:
     if not os.path.exists(manifest_path):
         sys.exit(0)
 
-    with open(manifest_path, "r") as f:
-        content = f.read()
-
-    lines = content.split("\n")
+    workitems = load_workitems(manifest_path)
 
     # Find active work item for current branch
     current_branch = get_current_branch(project_root)
     if not current_branch:
         sys.exit(0)
 
-    slug, slug_start = find_active_workitem_for_branch(lines, current_branch)
+    slug = find_active_workitem_for_branch(workitems, current_branch)
     if not slug:
         sys.exit(0)
 
     # Read current docs field values
-    docs_fields = read_docs_fields(lines, slug_start)
+    docs_fields = read_docs_fields(workitems[slug])
     if not docs_fields:
         print(f"[VibeFlow] Warning: No docs section found for work item '{slug}'")
         sys.exit(0)
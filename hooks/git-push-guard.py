@@ -11,50 +11,44 @@ Input: JSON on stdin with tool_name, tool_input
 Output: JSON on stdout with decision (always "allow") and optional reason
 """
 
-import json
-import os
-import subprocess
 import sys
 
-# Stage -> checkpoint mapping (same as checkpoint-gate.py)
-STAGE_CHECKPOINT = {
-    "D": 1,
-    "E": 2,
-    "F": 3,
-    "H": 4,
-    "J": 5,
-    "L": 6,
-}
+# Pre-encoded response for the common allow path
+ALLOW = '{"decision":"allow"}'
 
 try:
-    hook_input = json.loads(sys.stdin.read())
+    raw_input = sys.stdin.read()
+
+    # Most Bash calls aren't pushes; skip them before parsing the JSON
+    if "git push" not in raw_input:
+        print(ALLOW)
+        sys.exit(0)
+
+    # Imported here so the non-push fast path above stays cheap
+    import json
+    import os
+
+    from _gitroot import get_git_context
+    from _manifest import STAGE_CHECKPOINT, find_workitem
+
+    hook_input = json.loads(raw_input)
     tool_name = hook_input.get("tool_name", "")
     tool_input = hook_input.get("tool_input", {})
 
     # Only check Bash calls with git push
     if tool_name != "Bash" or "git push" not in tool_input.get("command", ""):
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     warnings = []
 
-    # Find project root
-    project_root = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, timeout=5
-    ).stdout.strip()
+    # Find project root and current branch
+    project_root, branch = get_git_context()
 
     if not project_root:
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
-    # Get current branch
-    branch = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True, text=True, timeout=5,
-        cwd=project_root
-    ).stdout.strip()
-
     if not branch.startswith("feat/"):
         warnings.append(f"Pushing from '{branch}' — not a feat/<slug> work item branch")
     else:
@@ -63,52 +57,17 @@ try:
         # Read manifest
         manifest_path = os.path.join(project_root, "docs", "workflow-state.yaml")
         if os.path.exists(manifest_path):
-            with open(manifest_path, "r") as f:
-                content = f.read()
-
-            # Parse manifest for this slug
-            in_workitems = False
-            current_slug = None
-            current_stage = None
-            current_checkpoint = 0
-            found = False
-
-            for line in content.split("\n"):
-                stripped = line.strip()
-                if stripped.startswith("#"):
-                    continue
-                if stripped == "workitems:":
-                    in_workitems = True
-                    continue
-                if not in_workitems:
-                    continue
-
-                if line.startswith("  ") and not line.startswith("    ") and ":" in stripped:
-                    if current_slug == slug:
-                        found = True
-                        break
-                    key = stripped.split(":")[0].strip()
-                    if key and not key.startswith("#"):
-                        current_slug = key
-                        current_stage = None
-                        current_checkpoint = 0
-                    else:
-                        current_slug = None
-                    continue
-
-                if current_slug and line.startswith("    ") and not line.startswith("      "):
-                    if stripped.startswith("stage:"):
-                        current_stage = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-                    elif stripped.startswith("checkpoint:"):
-                        try:
-                            current_checkpoint = int(stripped.split(":", 1)[1].strip())
-                        except ValueError:
-                            current_checkpoint = 0
-
-            if current_slug == slug:
-                found = True
-
-            if not found:
+            # Reads only this slug's block of the manifest
+            found_slug, item = find_workitem(manifest_path, slug)
+            if found_slug != slug:
+                item = None  # matched by id, not by the branch's slug
+            current_stage = item.get("stage") if item else None
+            try:
+                current_checkpoint = int(item.get("checkpoint", 0)) if item else 0
+            except ValueError:
+                current_checkpoint = 0
+
+            if item is None:
                 warnings.append(f"Branch '{branch}' does not match any active work item")
             elif current_stage and current_stage in STAGE_CHECKPOINT:
                 required = STAGE_CHECKPOINT[current_stage]
@@ -124,10 +83,10 @@ try:
             "reason": "[VibeFlow] Advisory: " + "; ".join(warnings)
         }))
     else:
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
 
 except Exception:
     # Fail open
-    print(json.dumps({"decision": "allow"}))
+    print(ALLOW)
 
 sys.exit(0)
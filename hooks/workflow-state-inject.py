@@ -10,85 +10,37 @@ Output format:
 
 import json
 import os
-import subprocess
 import sys
 
+from _gitroot import get_git_context
+from _manifest import load_workitems
+
+# Pre-encoded response for the common allow path
+ALLOW = '{"decision":"allow"}'
+
 try:
-    # Find project root
-    project_root = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, timeout=5
-    ).stdout.strip()
+    # Find project root and current branch
+    project_root, current_branch = get_git_context()
 
     if not project_root:
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     manifest_path = os.path.join(project_root, "docs", "workflow-state.yaml")
     if not os.path.exists(manifest_path):
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
-    # Get current branch
-    current_branch = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True, text=True, timeout=5,
-        cwd=project_root
-    ).stdout.strip()
-
-    with open(manifest_path, "r") as f:
-        manifest_content = f.read()
-
     # Parse active work items
     items = []
-    in_workitems = False
-    current_slug = None
-    current_stage = None
-    current_branch_field = None
-    current_track = None
-
-    for line in manifest_content.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("#"):
-            continue
-        if stripped == "workitems:":
-            in_workitems = True
-            continue
-        if not in_workitems:
-            continue
-
-        # Detect work item key
-        if line.startswith("  ") and not line.startswith("    ") and ":" in stripped:
-            # Save previous item
-            if current_slug and current_stage and current_stage != "DONE":
-                branch = current_branch_field or f"feat/{current_slug}"
-                items.append((current_slug, current_stage, branch, current_track))
-
-            key = stripped.split(":")[0].strip()
-            if key and not key.startswith("#"):
-                current_slug = key
-                current_stage = None
-                current_branch_field = None
-                current_track = None
-            else:
-                current_slug = None
-            continue
-
-        if current_slug and line.startswith("    ") and not line.startswith("      "):
-            if stripped.startswith("stage:"):
-                current_stage = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-            elif stripped.startswith("branch:"):
-                current_branch_field = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-            elif stripped.startswith("track:"):
-                current_track = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-
-    # Handle last item
-    if current_slug and current_stage and current_stage != "DONE":
-        branch = current_branch_field or f"feat/{current_slug}"
-        items.append((current_slug, current_stage, branch, current_track))
+    for slug, item in load_workitems(manifest_path).items():
+        stage = item.get("stage")
+        if stage and stage != "DONE":
+            branch = item.get("branch") or f"feat/{slug}"
+            items.append((slug, stage, branch, item.get("track")))
 
     if not items:
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     # Build status message
@@ -103,5 +55,5 @@ try:
 
 except Exception:
     # Fail open — always output valid JSON
-    print(json.dumps({"decision": "allow"}))
+    print(ALLOW)
     sys.exit(0)
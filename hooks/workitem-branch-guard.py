@@ -15,9 +15,11 @@ Output: JSON on stdout with decision (allow/block) and reason
 
 import json
 import os
-import subprocess
 import sys
 
+# Pre-encoded response for the common allow path
+ALLOW = '{"decision":"allow"}'
+
 try:
     # Parse hook input
     hook_input = json.loads(sys.stdin.read())
@@ -26,88 +28,38 @@ try:
     # Allow manage-work commands on any branch (needed to register/manage work items)
     workitem_keywords = ["manage-work", "register", "clarify-demand"]
     if any(kw in user_prompt for kw in workitem_keywords):
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
-    # Find project root
-    project_root = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True, timeout=5
-    ).stdout.strip()
+    # Imported here so the manage-work fast path above stays cheap
+    from _gitroot import get_git_context
+    from _manifest import load_workitems
+
+    # Find project root and current branch
+    project_root, current_branch = get_git_context()
 
     if not project_root:
         # Not in a git repo — allow
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
-    # Get current branch
-    result = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True, text=True, timeout=5,
-        cwd=project_root
-    )
-    current_branch = result.stdout.strip()
-
     # Check manifest
     manifest_path = os.path.join(project_root, "docs", "workflow-state.yaml")
     if not os.path.exists(manifest_path):
         # No manifest yet — allow (user may be setting up the project)
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
-    # Parse manifest (simple YAML parsing without external deps)
-    with open(manifest_path, "r") as f:
-        manifest_content = f.read()
-
     # Extract active work items from manifest
-    active_branches = set()
-    in_workitems = False
-    current_slug = None
-    current_stage = None
-    current_branch_field = None
-    current_has_branch = False
-
-    for line in manifest_content.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("#"):
-            continue
-        if stripped == "workitems:":
-            in_workitems = True
-            continue
-        if not in_workitems:
-            continue
-
-        # Detect work item key (top-level under workitems, 2-space indent)
-        if line.startswith("  ") and not line.startswith("    ") and ":" in stripped:
-            # Save previous item
-            if current_slug and current_stage != "DONE":
-                branch = current_branch_field or f"feat/{current_slug}"
-                active_branches.add(branch)
-
-            key = stripped.split(":")[0].strip()
-            if key and not key.startswith("#"):
-                current_slug = key
-                current_stage = None
-                current_branch_field = None
-            else:
-                current_slug = None
-            continue
-
-        # Detect stage and branch fields
-        if current_slug and line.startswith("    ") and not line.startswith("      "):
-            if stripped.startswith("stage:"):
-                current_stage = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-            elif stripped.startswith("branch:"):
-                current_branch_field = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-
-    # Handle last item
-    if current_slug and current_stage != "DONE":
-        branch = current_branch_field or f"feat/{current_slug}"
-        active_branches.add(branch)
+    active_branches = {
+        item.get("branch") or f"feat/{slug}"
+        for slug, item in load_workitems(manifest_path).items()
+        if item.get("stage") != "DONE"
+    }
 
     if not active_branches:
         # No active work items — allow (manifest might be empty or all DONE)
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     # Block on main/master when active work items exist
@@ -121,7 +73,7 @@ try:
 
     # Check if branch matches an active work item
     if current_branch in active_branches:
-        print(json.dumps({"decision": "allow"}))
+        print(ALLOW)
         sys.exit(0)
 
     # Branch doesn't match any active work item
@@ -133,4 +85,4 @@ try:
 
 except Exception as e:
     # Fail open — never block due to script errors
-    print(json.dumps({"decision": "allow"}))
+    print(ALLOW)